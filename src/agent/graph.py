@@ -7,8 +7,17 @@ that allow for error recovery and self-correction.
 
 from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING
+
 from langgraph.graph import StateGraph, START, END
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.types import CachePolicy
+
+if TYPE_CHECKING:
+    # Annotation-only import: keeps the grpc/protobuf chain off the module
+    # import path (cold-start cost), matching the node modules.
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
 from .state import AgentState
 from .nodes.planner import planner_node
@@ -21,8 +30,42 @@ from .nodes.interpreter import interpreter_node
 # ==========================================
 from .routers import route_after_tool, route_after_analysis
 
+# ==========================================
+# COMPILATION CACHE (NEW)
+# The compiled graph is immutable and reusable, so rebuilding + recompiling it
+# per request is pure overhead (node/edge wiring + schema validation each time).
+# Memoize per llm instance/model so repeated requests are a dict lookup.
+# ==========================================
+_COMPILED_CACHE: dict = {}
+
+
+def _analysis_cache_key(state: AgentState) -> str:
+    """
+    Node-cache key for analysis: its output is deterministic given the loaded
+    data, the selected target and the requested tools, so identical runs can
+    reuse the prior correlation result instead of recomputing it.
+
+    Keyed on content identity from dataset_meta (path, mtime, size,
+    sample_rows) rather than id(df) — tool_node loads a fresh frame every run,
+    so an object-identity key never hits and can alias across a persistent
+    cache backend once ids are recycled. The AGENT_DOWNCAST flag is included
+    because it changes the loaded values.
+    """
+    meta = (state.get("tool_result") or {}).get("dataset_meta") or {}
+    target = state.get("target") or (state.get("target_selection") or {}).get("selected_target")
+    parts = (
+        meta.get("path"),
+        meta.get("mtime_ns"),
+        meta.get("size_bytes"),
+        meta.get("sample_rows"),
+        os.getenv("AGENT_DOWNCAST", "0").strip(),
+        target,
+        ",".join(state.get("plan_tools") or ()),
+    )
+    return "|".join(str(p) for p in parts)
+
 
-def build_graph(llm: ChatGoogleGenerativeAI):
+def build_graph(llm: ChatGoogleGenerativeAI, *, planner_llm=None, cache=None, checkpointer=None):
     """
     Phase 3 graph (Cyclic/Agentic):
       START -> tool
@@ -30,13 +73,52 @@ def build_graph(llm: ChatGoogleGenerativeAI):
       planner -> analysis
       analysis -> [route_after_analysis] -> interpreter OR planner (retry loop)
       interpreter -> END
+
+    Compiled graphs are cached keyed on the llm instance (falling back to model
+    name), so calling build_graph repeatedly with the same client is cheap.
+
+    Optional `planner_llm` dedicates a separate client to the planner — e.g.
+    one built with a provider-side cached_content for the static planner
+    rubric (see planner.create_planner_prompt_cache). Defaults to `llm`.
+
+    Optional `cache` (a langgraph BaseCache) enables node-level memoization of
+    the deterministic analysis node on (dataset identity, target, plan tools)
+    — useful when only the question changes between runs. `checkpointer` is
+    passed to compile() for state persistence/replay; since AgentState carries
+    the raw DataFrame, a checkpointer using the default serde is upgraded to
+    one with pickle fallback so state serialization does not crash on `df`.
     """
+    # Key on identity first (node closures capture this exact llm object);
+    # include model name so distinct clients of the same model stay distinct.
+    # Runs with a cache/checkpointer are not memoized (they carry run-specific
+    # backends).
+    planner_llm = planner_llm or llm
+    cache_key = (id(llm), id(planner_llm), getattr(llm, "model", None))
+    if cache is None and checkpointer is None:
+        cached = _COMPILED_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
     g = StateGraph(AgentState)
 
+    # planner/interpreter are async nodes (llm.ainvoke); LangGraph runs them
+    # natively when the compiled graph is driven via `ainvoke`/`astream`.
+    async def _planner(state: AgentState):
+        return await planner_node(state, planner_llm)
+
+    async def _interpreter(state: AgentState):
+        return await interpreter_node(state, llm)
+
     g.add_node("tool", tool_node)
-    g.add_node("planner", lambda state: planner_node(state, llm))
-    g.add_node("analysis", analysis_node)
-    g.add_node("interpreter", lambda state: interpreter_node(state, llm))
+    g.add_node("planner", _planner)
+    # analysis is deterministic given (dataset, target, tools): memoizable
+    # when a cache backend is supplied at compile time.
+    g.add_node(
+        "analysis",
+        analysis_node,
+        cache_policy=CachePolicy(key_func=_analysis_cache_key) if cache is not None else None,
+    )
+    g.add_node("interpreter", _interpreter)
 
     # 1. Start execution
     g.add_edge(START, "tool")
@@ -69,4 +151,14 @@ def build_graph(llm: ChatGoogleGenerativeAI):
     # 5. End execution
     g.add_edge("interpreter", END)
 
-    return g.compile()
\ No newline at end of file
+    if checkpointer is not None:
+        serde = getattr(checkpointer, "serde", None)
+        if isinstance(serde, JsonPlusSerializer) and not serde.pickle_fallback:
+            # The default serde raises on the DataFrame in state; pickle
+            # fallback keeps msgpack for everything JSON-like and pickles df.
+            checkpointer.serde = JsonPlusSerializer(pickle_fallback=True)
+
+    compiled = g.compile(cache=cache, checkpointer=checkpointer)
+    if cache is None and checkpointer is None:
+        _COMPILED_CACHE[cache_key] = compiled
+    return compiled
\ No newline at end of file
@@ -9,18 +9,57 @@ and increments the 'retry_count' to trigger the Planner's self-correction mechan
 from __future__ import annotations
 from typing import Dict, Any, List
 
+import asyncio
+
 import pandas as pd
 
-from ..state import AgentState
+from ..state import AgentState, EMPTY_MAP
 from ...tools.correlation import compute_pearson_correlation
-from ...tools.public_view import make_public_tool_result
+from ...tools.public_view import make_public_tool_result, next_view_rev, DEFAULT_ALLOWLIST
+
+# Keys whose change invalidates the cached public view; anything else
+# (internal gating/debug payloads) leaves public_tool_result untouched.
+_PUBLIC_VIEW_KEYS = frozenset(DEFAULT_ALLOWLIST)
 
 
 def _merge_tool_result(state: AgentState, updates: Dict[str, Any]) -> Dict[str, Any]:
-    base = state.get("tool_result", {}) or {}
-    merged = dict(base)
-    merged.update(updates)
-    return merged
+    # Single-pass pre-sized merge instead of copy-then-update. The _rev stamp
+    # lets make_public_tool_result memoize views of this exact dict.
+    return (state.get("tool_result") or EMPTY_MAP) | updates | {"_rev": next_view_rev()}
+
+
+def _refresh_public_view(merged: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """
+    Recompute public_tool_result only when an allowlisted key actually changed;
+    otherwise reuse the existing view and skip the full traversal.
+    """
+    if _PUBLIC_VIEW_KEYS & updates.keys() or "public_tool_result" not in merged:
+        merged["public_tool_result"] = make_public_tool_result(merged)
+
+
+def _error_state_update(state: AgentState, error_msg: str) -> Dict[str, Any]:
+    """
+    Build the node update for a validation failure (missing df / target).
+
+    The existing public view (dataset_meta, target_candidates, ...) is kept
+    with just the error set on top — the interpreter still needs dataset
+    context when retries exhaust, and reusing the view avoids the full
+    make_public_tool_result traversal. Also records the error for the
+    planner's self-correction loop.
+    """
+    error = {"message": error_msg, "payload": {}}
+    merged = _merge_tool_result(state, {"error": error})
+    prev_view = merged.get("public_tool_result")
+    if isinstance(prev_view, dict):
+        merged["public_tool_result"] = prev_view | {"error": error}
+    else:
+        merged["public_tool_result"] = make_public_tool_result(merged)
+
+    return {
+        "tool_result": merged,
+        "error_log": state.get("error_log", []) + [error_msg],
+        "retry_count": state.get("retry_count", 0) + 1,
+    }
 
 
 def _plan_tools_from_state(state: AgentState) -> List[str]:
@@ -53,66 +92,34 @@ def _plan_tools_from_state(state: AgentState) -> List[str]:
     return tags
 
 
-def analysis_node(state: AgentState) -> Dict[str, Any]:
+async def analysis_node(state: AgentState) -> Dict[str, Any]:
     """
     Analysis orchestration node (gating-enabled):
     - Use planner's machine-readable `plan_tools` for deterministic gating.
     - Fallback to simple rule-based decisions if plan_tools is absent.
     - Run selected analysis tools (first version: correlation).
     - Merge results back into tool_result and store a stable public view.
+
+    Async node: selected tools are dispatched to worker threads and gathered,
+    so once more tools exist (baseline_model, plot, ...) total analysis time
+    is max(tool_times) instead of their sum.
     """
     df = state.get("df")
     if df is None or not isinstance(df, pd.DataFrame):
-        error_msg = "analysis_node: missing df in state"
-        merged = _merge_tool_result(
-            state,
-            {"error": {"message": error_msg, "payload": {}}},
-        )
-        merged["public_tool_result"] = make_public_tool_result(merged)
-        
-        # -------------------------
-        # ERROR REPORTING LOGIC (NEW)
-        # Update memory for cyclic error recovery
-        # -------------------------
-        current_log = state.get("error_log", [])
-        new_retry_count = state.get("retry_count", 0) + 1
-        
-        return {
-            "tool_result": merged,
-            "error_log": current_log + [error_msg],
-            "retry_count": new_retry_count
-        }
+        return _error_state_update(state, "analysis_node: missing df in state")
 
     # determine selected target (planner should set this)
     target = state.get("target")
     if not target:
-        ts = state.get("target_selection", {}) or {}
+        ts = state.get("target_selection") or EMPTY_MAP
         target = ts.get("selected_target")
 
     if not target:
-        error_msg = "analysis_node: missing selected target"
-        merged = _merge_tool_result(
-            state,
-            {"error": {"message": error_msg, "payload": {}}},
-        )
-        merged["public_tool_result"] = make_public_tool_result(merged)
-        
-        # -------------------------
-        # ERROR REPORTING LOGIC (NEW)
-        # Update memory for cyclic error recovery
-        # -------------------------
-        current_log = state.get("error_log", [])
-        new_retry_count = state.get("retry_count", 0) + 1
-        
-        return {
-            "tool_result": merged,
-            "error_log": current_log + [error_msg],
-            "retry_count": new_retry_count
-        }
-
-    tool_result = state.get("tool_result", {}) or {}
+        return _error_state_update(state, "analysis_node: missing selected target")
+
+    tool_result = state.get("tool_result") or EMPTY_MAP
     task_type = tool_result.get("task_type")
-    schema_summary = tool_result.get("schema_summary", {}) or {}
+    schema_summary = tool_result.get("schema_summary") or EMPTY_MAP
 
     # -------------------------
     # GATING: use planner tags first, fallback to rules
@@ -148,21 +155,36 @@ def analysis_node(state: AgentState) -> Dict[str, Any]:
 
     updates: Dict[str, Any] = {}
     # -------------------------
-    # Execute selected analyses
+    # Execute selected analyses (fan out, then gather)
     # -------------------------
+    tool_tasks: Dict[str, Any] = {}
     if should_run_correlation:
-        corr_payload = compute_pearson_correlation(df, target=target, top_k=8)
-        updates["correlation"] = corr_payload
-        updates["analysis_executed"] = {"correlation": True, "task_type_seen": task_type}
-    else:
-        updates["analysis_executed"] = {"correlation": False, "task_type_seen": task_type}
+        tool_tasks["correlation"] = asyncio.to_thread(
+            compute_pearson_correlation,
+            df,
+            target=target,
+            top_k=8,
+            # schema already knows the numeric columns; skip the dtype rescan
+            numeric_cols=numeric_columns or None,
+        )
+    # Future tools (baseline_model, plot, ...) join tool_tasks here and run
+    # concurrently in the same gather.
+
+    if tool_tasks:
+        results = await asyncio.gather(*tool_tasks.values())
+        updates.update(zip(tool_tasks.keys(), results))
+
+    updates["analysis_executed"] = {
+        "correlation": should_run_correlation,
+        "task_type_seen": task_type,
+    }
 
     # store gating summary for observability
     updates["analysis_gating"] = gating_summary
 
     # Merge and store public view inside tool_result (stable across graph merges)
     merged = _merge_tool_result(state, updates)
-    merged["public_tool_result"] = make_public_tool_result(merged)
+    _refresh_public_view(merged, updates)
 
     # If execution succeeds, we simply return the updated tool_result
     return {"tool_result": merged}
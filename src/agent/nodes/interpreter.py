@@ -1,17 +1,59 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+if TYPE_CHECKING:
+    # Annotation-only import: pulling in langchain_google_genai (grpc,
+    # protobuf, google auth) at runtime costs hundreds of ms of cold start.
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
-from ..state import AgentState
+from ..state import AgentState, EMPTY_MAP
+
+# orjson: C-level JSON encoding, much faster than dict.__repr__ and emits
+# tight, deterministic JSON (fewer tokens, stable bytes for provider-side
+# prompt caching). Fall back to stdlib json when unavailable.
+try:
+    import orjson
+
+    def _dumps_compact(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+
+except ImportError:  # pragma: no cover - depends on environment
+    import json
+
+    def _dumps_compact(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+# Static interpreter rubric, built once at import time: avoids a fresh
+# multi-line str allocation per call and keeps the prompt prefix byte-stable
+# for provider-side prompt caching.
+_INTERPRETER_SYSTEM = (
+    "You are a business analyst. Use the provided summary as ground truth. "
+    "Write a clear, concise answer in English.\n\n"
+    "Rules:\n"
+    "- Do NOT repeat the raw JSON/dict.\n"
+    "- Focus on answering the user's question.\n"
+    "- If the needed analysis results are missing, state what is missing in ONE sentence "
+    "and suggest the next computation to run.\n"
+    "- Keep the answer short (3-6 sentences)."
+)
 
 
 def _safe_get(d: Dict[str, Any], path: List[str], default=None):
+    # EAFP: let the C-level __getitem__ do the work and catch the failure,
+    # instead of paying an isinstance + membership check per level.
+    if len(path) == 2:  # common case here: one nested hop
+        first = d.get(path[0])
+        if isinstance(first, dict):
+            return first.get(path[1], default)
+        return default
+
     cur: Any = d
-    for k in path:
-        if not isinstance(cur, dict) or k not in cur:
-            return default
-        cur = cur[k]
+    try:
+        for k in path:
+            cur = cur[k]
+    except (KeyError, TypeError, IndexError):
+        return default
     return cur
 
 
@@ -20,7 +62,7 @@ def _compact_tool_result(state: AgentState) -> Dict[str, Any]:
     Fallback compact summary of internal tool_result.
     Used only when public_tool_result is not available.
     """
-    tool_result = state.get("tool_result", {}) or {}
+    tool_result = state.get("tool_result") or EMPTY_MAP
 
     dataset_meta = tool_result.get("dataset_meta") or {}
     schema_summary = tool_result.get("schema_summary") or {}
@@ -75,33 +117,36 @@ def _compact_tool_result(state: AgentState) -> Dict[str, Any]:
     return compact
 
 
-def interpreter_node(state: AgentState, llm: ChatGoogleGenerativeAI) -> Dict[str, Any]:
+async def interpreter_node(state: AgentState, llm: ChatGoogleGenerativeAI) -> Dict[str, Any]:
     """
     Turn analysis results into a stakeholder-friendly answer.
 
     Key behavior:
     - Prefer public_tool_result as ground truth (deterministic, curated, stable).
     - Fallback to a compact view of internal tool_result if public_tool_result is missing.
+    - Async node: streams the LLM response (`llm.astream`) so drivers using
+      `graph.astream_events` can forward tokens as they arrive — user-perceived
+      latency becomes time-to-first-token instead of full decode time. The
+      accumulated text still lands in `final_answer` for non-streaming callers.
     """
-    public_view = (state.get("tool_result", {}) or {}).get("public_tool_result")
-    summary = public_view if isinstance(public_view, dict) and public_view else _compact_tool_result(state)
-
-    system = (
-        "You are a business analyst. Use the provided summary as ground truth. "
-        "Write a clear, concise answer in English.\n\n"
-        "Rules:\n"
-        "- Do NOT repeat the raw JSON/dict.\n"
-        "- Focus on answering the user's question.\n"
-        "- If the needed analysis results are missing, state what is missing in ONE sentence "
-        "and suggest the next computation to run.\n"
-        "- Keep the answer short (3-6 sentences)."
-    )
-
+    # Check for the curated public view FIRST: when it exists (the common case,
+    # since analysis_node always produces one), the compact fallback walk over
+    # the nested tool_result is skipped entirely.
+    public_view = (state.get("tool_result") or EMPTY_MAP).get("public_tool_result")
+    if isinstance(public_view, dict) and public_view:
+        summary = public_view
+    else:
+        summary = _compact_tool_result(state)
+
+    # JSON (not repr) keeps the payload compact, unambiguous for the LLM,
+    # and byte-stable across calls.
     user = (
         f"Question: {state['question']}\n"
-        f"Plan: {state.get('plan')}\n"
-        f"Summary: {summary}\n"
+        f"Plan: {_dumps_compact(state.get('plan'))}\n"
+        f"Summary: {_dumps_compact(summary)}\n"
     )
 
-    final = llm.invoke([("system", system), ("user", user)]).content
-    return {"final_answer": final}
+    chunks: List[str] = []
+    async for chunk in llm.astream([("system", _INTERPRETER_SYSTEM), ("user", user)]):
+        chunks.append(chunk.content)
+    return {"final_answer": "".join(chunks)}
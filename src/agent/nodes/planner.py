@@ -7,16 +7,73 @@ and adjust its planning strategy accordingly.
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple
-from dataclasses import asdict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
+from dataclasses import fields
+import asyncio
+import heapq
+import os
 import re
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-
-from ..state import AgentState
-from ...tools.target_rerank_llm import rerank_target_candidates_with_llm
+if TYPE_CHECKING:
+    # Annotation-only import: pulling in langchain_google_genai (grpc,
+    # protobuf, google auth) at runtime costs hundreds of ms of cold start.
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+from ..state import AgentState, EMPTY_MAP
+from ..plan_cache import get_plan_cache, schema_fingerprint
+from ...tools.target_rerank_llm import (
+    rerank_and_plan_with_llm,
+    rerank_target_candidates_with_llm,
+)
 from ...tools.task_type_inference import infer_task_type  # Phase 2.2.3
 
+# Outcome-intent keywords compiled once into a single alternation: one DFA
+# pass over the question instead of one substring scan per keyword.
+_OUTCOME_RE = re.compile(
+    r"predict|prediction|classif(?:y|ication)|regression|label|target|outcome|churn|conversion",
+    re.IGNORECASE,
+)
+
+# Static planner rubric, built once at import time: avoids a fresh multi-line
+# str allocation per call and keeps the prompt prefix byte-stable so
+# provider-side prompt caching can key on it.
+_PLANNER_SYSTEM = (
+    "You are a data analysis planner. "
+    "Return a short step-by-step plan (2-4 steps) to answer the user's question using pandas. "
+    "For each step, include a short natural-language instruction and, if relevant, "
+    "append a tool tag in the exact format [TOOL:<tool_name>] (examples: [TOOL:correlation], "
+    "[TOOL:baseline_model], [TOOL:plot]).\n"
+    "Keep steps concise and actionable. Do NOT invent new tools beyond the examples."
+)
+
+
+def create_planner_prompt_cache(model_name: str, *, ttl_seconds: int = 3600) -> str | None:
+    """
+    Opt-in provider-side prompt caching for the static planner rubric.
+
+    Creates a Gemini CachedContent holding _PLANNER_SYSTEM as the system
+    instruction and returns its resource name, so a dedicated planner client
+    can be built with `ChatGoogleGenerativeAI(..., cached_content=name)` and
+    the static prefix is prefilled/billed once per TTL instead of per call.
+
+    Returns None (and the caller keeps the plain invoke path) when the SDK
+    lacks caching support or creation fails — e.g. offline or model without
+    cache support. Dynamic inputs (question, target, error log) stay in the
+    per-call user message so the cache key remains stable.
+    """
+    try:
+        import datetime
+        from google.generativeai import caching
+
+        cached = caching.CachedContent.create(
+            model=model_name,
+            system_instruction=_PLANNER_SYSTEM,
+            ttl=datetime.timedelta(seconds=ttl_seconds),
+        )
+        return cached.name
+    except Exception:
+        return None
+
 
 def _should_rerank_with_llm(question: str, candidates: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
     """
@@ -27,36 +84,130 @@ def _should_rerank_with_llm(question: str, candidates: List[Dict[str, Any]]) ->
     if not candidates or len(candidates) < 2:
         return False, ["insufficient_candidates"]
 
-    # defensive sort by heuristic score
-    c_sorted = sorted(candidates, key=lambda x: float(x.get("score", 0.0)), reverse=True)
-    top1, top2 = c_sorted[0], c_sorted[1]
+    # defensive top-2 by heuristic score; nlargest(2) is O(n) and avoids
+    # materializing a fully sorted copy just to read two entries
+    top1, top2 = heapq.nlargest(2, candidates, key=lambda x: float(x.get("score", 0.0)))
 
     s1 = float(top1.get("score", 0.0))
     s2 = float(top2.get("score", 0.0))
     gap = s1 - s2
 
-    top1_reasons = " ".join([str(r) for r in top1.get("reasons", [])]).lower()
-    q = (question or "").lower()
-
     # 1) small score gap => uncertainty
     if gap < 0.15:
         reasons.append(f"small_score_gap({gap:.2f})")
 
-    # 2) no name-based signal on top1
-    if ("strong_name_token" not in top1_reasons) and ("domain_name_token" not in top1_reasons):
+    # 2) no name-based signal on top1 (scan reasons directly instead of
+    #    building a joined+lowered string first)
+    has_name_signal = any(
+        "strong_name_token" in str(r) or "domain_name_token" in str(r)
+        for r in top1.get("reasons", [])
+    )
+    if not has_name_signal:
         reasons.append("top1_missing_name_signal")
 
     # 3) question strongly implies outcome but top1 score is not confident
-    outcome_keywords = [
-        "predict", "prediction", "classify", "classification", "regression",
-        "label", "target", "outcome", "churn", "conversion"
-    ]
-    if any(k in q for k in outcome_keywords) and s1 < 0.6:
+    if s1 < 0.6 and _OUTCOME_RE.search(question or ""):
         reasons.append("question_outcome_intent_but_low_top1_score")
 
     return (len(reasons) > 0), reasons
 
 
+def _build_plan_messages(
+    question: str,
+    selected_target,
+    error_log: List[str],
+    *,
+    with_system: bool = True,
+) -> List[Tuple[str, str]]:
+    """
+    Build the (system, user) message pair for the plan-generation LLM call.
+
+    Shared by the per-state `planner_node` and the batched `planner_batch_node`
+    so both paths ship byte-identical prompts. Pass with_system=False when the
+    client carries a provider-side cached_content (the rubric is then injected
+    from the cache and must not be re-sent).
+    """
+    user = (
+        f"Question: {question}\n"
+        f"Selected target column: {selected_target}\n"
+        f"Note: If target is None, propose how to identify it from the dataset.\n"
+    )
+
+    # SELF-CORRECTION LOGIC: inject past errors so the LLM can learn and adapt
+    if error_log:
+        error_str = "\n".join([f"- {err}" for err in error_log])
+        user += (
+            f"\n=== CRITICAL: PREVIOUS EXECUTION ERRORS ===\n"
+            f"You previously generated a plan, but it failed during execution with the following errors:\n"
+            f"{error_str}\n"
+            f"You MUST reflect on these errors. Provide a DIFFERENT plan, use DIFFERENT tool tags, "
+            f"or select a DIFFERENT approach to avoid repeating the same mistake."
+        )
+
+    if not with_system:
+        return [("user", user)]
+    return [("system", _PLANNER_SYSTEM), ("user", user)]
+
+
+# ---------------------------------------------------------------------------
+# Deterministic planner fast path (opt-in, PLANNER_FAST_PATH=1).
+#
+# The planner LLM's only machine-consumed output is plan_tools; for questions
+# with a single unambiguous intent the tool set is fully determined by keyword
+# matching, so the plan-generation round-trip can be skipped and a template
+# plan synthesized instead. Ambiguous questions (zero or multiple intents)
+# fall through to the LLM path.
+# ---------------------------------------------------------------------------
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+_FAST_PATH_INTENTS: Tuple[Tuple[frozenset, str], ...] = (
+    (frozenset({"correlation", "correlations", "correlate", "impact", "influence", "strongest"}), "correlation"),
+    (frozenset({"predict", "predicts", "classify", "classification", "baseline"}), "baseline_model"),
+)
+
+
+def _fast_path_plan(question: str, selected_target) -> Optional[Tuple[List[str], List[str]]]:
+    """Return (plan, plan_tools) for unambiguous questions, else None."""
+    if os.getenv("PLANNER_FAST_PATH", "0").strip() != "1":
+        return None
+
+    tokens = set(_WORD_RE.findall((question or "").lower()))
+    matched = [tool for keywords, tool in _FAST_PATH_INTENTS if tokens & keywords]
+    if len(matched) != 1:
+        return None  # no signal or conflicting intents -> let the LLM plan
+
+    tool = matched[0]
+    target_desc = f"'{selected_target}'" if selected_target else "the inferred target"
+    if tool == "correlation":
+        plan = [
+            f"Compute Pearson correlations of numeric features against {target_desc} [TOOL:correlation]",
+            "Summarize the strongest positive and negative relationships",
+        ]
+    else:
+        plan = [
+            f"Train a baseline model predicting {target_desc} [TOOL:baseline_model]",
+            "Report baseline metrics and the key drivers",
+        ]
+    return plan, [tool]
+
+
+# One multiline pattern extracts every plan line with leading bullets/
+# whitespace and trailing whitespace stripped in a single C-level scan,
+# instead of splitlines() plus two str.strip calls per line.
+_PLAN_LINE_RE = re.compile(r"^[-•*\s]*(\S.*?)\s*$", re.MULTILINE)
+
+# Tool-tag pattern compiled once per process instead of per planner call.
+_TOOL_TAG_RE = re.compile(r"\[TOOL:([a-zA-Z0-9_+-]+)\]", re.IGNORECASE)
+
+
+def _parse_plan_response(msg: str) -> Tuple[List[str], List[str]]:
+    """Turn a raw LLM plan response into (plan lines, extracted tool tags)."""
+    plan: List[str] = _PLAN_LINE_RE.findall(msg)[:4]
+    if not plan:
+        plan = ["Load the dataset", "Compute relevant summary stats", "Answer the question"]
+    return plan, _extract_tool_tags_from_plan(plan)
+
+
 def _extract_tool_tags_from_plan(plan_lines: List[str]) -> List[str]:
     """
     Deterministic parser for planner tool tags.
@@ -68,20 +219,24 @@ def _extract_tool_tags_from_plan(plan_lines: List[str]) -> List[str]:
     The downstream analysis_node should use these tags for deterministic gating
     (i.e., if 'correlation' in plan_tools => run correlation).
     """
-    tags = []
-    tag_re = re.compile(r"\[TOOL:([a-zA-Z0-9_+-]+)\]", flags=re.IGNORECASE)
-    for line in plan_lines:
-        for m in tag_re.finditer(line):
-            tag = m.group(1).lower()
-            if tag not in tags:
-                tags.append(tag)
-    return tags
+    # dict.fromkeys = order-preserving dedup with O(1) membership, instead of
+    # an O(n^2) `tag not in list` scan per match.
+    return list(
+        dict.fromkeys(
+            m.group(1).lower() for line in plan_lines for m in _TOOL_TAG_RE.finditer(line)
+        )
+    )
 
 
-def planner_node(state: AgentState, llm: ChatGoogleGenerativeAI) -> Dict[str, Any]:
+async def planner_node(state: AgentState, llm: ChatGoogleGenerativeAI) -> Dict[str, Any]:
     """
     Produce an analysis plan and select a target variable.
 
+    Async node: the plan-generation call uses `llm.ainvoke` so the LangGraph
+    superstep does not block the event loop on network I/O. When the graph is
+    driven via `ainvoke` (and fanned out with asyncio.gather for batches),
+    multiple questions proceed concurrently instead of serially.
+
     Phase 2.2.2 (in planner): optionally re-rank heuristic target candidates using LLM,
     gated by deterministic uncertainty rules. If rerank is not triggered or fails,
     fall back to the heuristic top candidate.
@@ -96,7 +251,7 @@ def planner_node(state: AgentState, llm: ChatGoogleGenerativeAI) -> Dict[str, An
     analysis_node to deterministically decide which tools to execute.
     """
     question = state["question"]
-    tool_result = state.get("tool_result", {}) or {}
+    tool_result = state.get("tool_result") or EMPTY_MAP
     
     # FETCH ERROR LOG: Retrieve past errors for reflection
     error_log = state.get("error_log", [])
@@ -109,76 +264,138 @@ def planner_node(state: AgentState, llm: ChatGoogleGenerativeAI) -> Dict[str, An
     selected_target = heuristic_top
     rerank_payload = None
 
+    df = state.get("df")  # tool_node must return {"df": df}
+
+    # -------------------------
+    # Phase 2.2.3: task type inference (rules-only)
+    # -------------------------
+    # The pandas-bound infer_task_type is independent of the network-bound LLM
+    # legs, so it is always overlapped with one of them: with the rerank call
+    # (speculatively on heuristic_top — the common final target) when rerank
+    # triggers, otherwise with the plan call below. tti_target records which
+    # target the current payload belongs to so a rerank that changes the
+    # target forces a recompute.
+    task_type_payload = None
+    tti_target = None
+
     should_rerank, gate_reasons = _should_rerank_with_llm(question, candidates)
 
+    # plan produced by the combined rerank+plan call, when that path succeeds
+    plan_from_rerank: Optional[List[str]] = None
+
     if should_rerank and schema_summary is not None and candidates:
-        rerank_payload = rerank_target_candidates_with_llm(
+        # One structured call covers both rerank and plan generation, halving
+        # LLM round-trips on the uncertain-target path; a None result (parse/
+        # validation failure) degrades to the original two-call sequence.
+        unified_call = rerank_and_plan_with_llm(
             llm=llm,
             question=question,
             heuristic_result=target_info,
             schema_summary=schema_summary,
             data_dictionary=state.get("data_dictionary"),  # optional
+            error_log=error_log,
         )
+        if df is not None and heuristic_top:
+            unified, task_type_payload = await asyncio.gather(
+                unified_call,
+                asyncio.to_thread(infer_task_type, df, heuristic_top),
+            )
+            tti_target = heuristic_top
+        else:
+            unified = await unified_call
+
+        if unified is not None:
+            plan_from_rerank = unified.pop("plan")
+            rerank_payload = unified
+        else:
+            rerank_payload = await asyncio.to_thread(
+                rerank_target_candidates_with_llm,
+                llm=llm,
+                question=question,
+                heuristic_result=target_info,
+                schema_summary=schema_summary,
+                data_dictionary=state.get("data_dictionary"),
+            )
         selected_target = rerank_payload.get("final_target") or heuristic_top
+        if tti_target is not None and tti_target != selected_target:
+            task_type_payload = None  # speculation missed; recompute below
+            tti_target = None
 
-    # -------------------------
-    # Phase 2.2.3: task type inference (rules-only)
-    # -------------------------
-    df = state.get("df")  # tool_node must return {"df": df}
-    task_type_payload = None
-    if df is not None and selected_target:
-        task_type_payload = infer_task_type(df, selected_target)
-
-    # Merge back into existing tool_result (do NOT overwrite other keys)
-    merged_tool_result = dict(tool_result)
-    if task_type_payload is not None:
-        payload_dict = asdict(task_type_payload)  # dataclass -> dict (JSON-friendly)
-        merged_tool_result["task_type"] = payload_dict["task_type"]
-        merged_tool_result["task_type_inference"] = payload_dict
-
-    # -------------------------
-    # Plan generation (updated to request tool tags)
-    # -------------------------
-    # The system prompt instructs the planner to include machine-readable tool tags
-    # next to steps. These tags are the bridge between LLM intent and deterministic
-    # execution: the analysis node will parse them and decide which tools to run.
-    system = (
-        "You are a data analysis planner. "
-        "Return a short step-by-step plan (2-4 steps) to answer the user's question using pandas. "
-        "For each step, include a short natural-language instruction and, if relevant, "
-        "append a tool tag in the exact format [TOOL:<tool_name>] (examples: [TOOL:correlation], "
-        "[TOOL:baseline_model], [TOOL:plot]).\n"
-        "Keep steps concise and actionable. Do NOT invent new tools beyond the examples."
-    )
-    
-    user = (
-        f"Question: {question}\n"
-        f"Selected target column: {selected_target}\n"
-        f"Note: If target is None, propose how to identify it from the dataset.\n"
-    )
+    # Deterministic fast path (opt-in, PLANNER_FAST_PATH=1): unambiguous
+    # intent keywords fully determine plan_tools, so skip the LLM round-trip
+    # and synthesize a template plan. Disabled on retries — reflection on the
+    # error log needs the LLM.
+    fast_plan = _fast_path_plan(question, selected_target) if not error_log else None
 
     # -------------------------
-    # SELF-CORRECTION LOGIC (NEW)
-    # Inject past errors into the prompt so the LLM can learn and adapt
+    # Plan cache (opt-in, PLAN_CACHE_ENABLED=1): near-duplicate questions on
+    # the same schema reuse the prior plan and skip the LLM call entirely.
+    # Skipped on retries — a failed plan must be regenerated, not replayed.
     # -------------------------
-    if error_log:
-        error_str = "\n".join([f"- {err}" for err in error_log])
-        user += (
-            f"\n=== CRITICAL: PREVIOUS EXECUTION ERRORS ===\n"
-            f"You previously generated a plan, but it failed during execution with the following errors:\n"
-            f"{error_str}\n"
-            f"You MUST reflect on these errors. Provide a DIFFERENT plan, use DIFFERENT tool tags, "
-            f"or select a DIFFERENT approach to avoid repeating the same mistake."
+    plan_cache = get_plan_cache() if not error_log else None
+    schema_fp = None
+    cached_plan = None
+    if fast_plan is None and plan_from_rerank is None and plan_cache is not None and schema_summary:
+        schema_fp = schema_fingerprint(schema_summary)
+        cached_plan = plan_cache.lookup(question, schema_fp)
+
+    if fast_plan is not None or plan_from_rerank is not None:
+        if fast_plan is not None:
+            plan, plan_tools = fast_plan
+        else:
+            plan = plan_from_rerank
+            plan_tools = _extract_tool_tags_from_plan(plan)
+        if task_type_payload is None and df is not None and selected_target:
+            task_type_payload = infer_task_type(df, selected_target)
+    elif cached_plan is not None:
+        plan, plan_tools = cached_plan["plan"], cached_plan["plan_tools"]
+        if task_type_payload is None and df is not None and selected_target:
+            task_type_payload = infer_task_type(df, selected_target)
+    else:
+        # The system prompt instructs the planner to include machine-readable tool
+        # tags next to steps. These tags are the bridge between LLM intent and
+        # deterministic execution: the analysis node parses them to pick tools.
+        messages = _build_plan_messages(
+            question,
+            selected_target,
+            error_log,
+            with_system=not getattr(llm, "cached_content", None),
         )
 
-    msg = llm.invoke([("system", system), ("user", user)]).content
+        if task_type_payload is None and df is not None and selected_target:
+            response, task_type_payload = await asyncio.gather(
+                llm.ainvoke(messages),
+                asyncio.to_thread(infer_task_type, df, selected_target),
+            )
+        else:
+            response = await llm.ainvoke(messages)
 
-    # Turn the LLM response into clean plan lines
-    plan: List[str] = [line.strip("-• ").strip() for line in msg.splitlines() if line.strip()]
-    plan = plan[:4] if plan else ["Load the dataset", "Compute relevant summary stats", "Answer the question"]
+        # Turn the LLM response into clean plan lines + deterministic tool tags
+        plan, plan_tools = _parse_plan_response(response.content)
 
-    # Parse tool tags from the plan deterministically
-    plan_tools: List[str] = _extract_tool_tags_from_plan(plan)
+        if plan_cache is not None and schema_fp is not None:
+            plan_cache.store(question, schema_fp, plan, plan_tools)
+
+    # Merge back into existing tool_result (do NOT overwrite other keys);
+    # single-pass `|` merge instead of copy-then-assign. tool_result came in
+    # via state, so it is not mutated in place — the `|` copy is the one
+    # unavoidable copy here.
+    if task_type_payload is not None:
+        # Single-level field read-out: TaskTypeInferenceResult is flat (str /
+        # list / dict fields), so the recursive deep copy in asdict() is
+        # wasted work. The two container fields still get shallow-copied —
+        # the payload may come from the infer_task_type memo, and sharing its
+        # lists/dicts by reference would let downstream mutation corrupt the
+        # cached entry for every later run.
+        payload_dict = {f.name: getattr(task_type_payload, f.name) for f in fields(task_type_payload)}
+        payload_dict["task_type_reasons"] = list(payload_dict["task_type_reasons"])
+        payload_dict["target_profile"] = dict(payload_dict["target_profile"])
+        merged_tool_result = tool_result | {
+            "task_type": payload_dict["task_type"],
+            "task_type_inference": payload_dict,
+        }
+    else:
+        merged_tool_result = tool_result
 
     out: Dict[str, Any] = {
         "plan": plan,
@@ -199,3 +416,40 @@ def planner_node(state: AgentState, llm: ChatGoogleGenerativeAI) -> Dict[str, An
 
     return out
 
+
+
+async def planner_batch_node(states: List[AgentState], llm: ChatGoogleGenerativeAI) -> List[Dict[str, Any]]:
+    """
+    Batched plan generation across multiple states.
+
+    Collects one (system, user) message pair per state and issues a single
+    `llm.abatch` round-trip instead of N sequential `ainvoke` calls, so cost
+    and latency are amortized across questions (provider batching coalesces
+    the requests up to its concurrency limit).
+
+    Scope note: this helper only batches the plan-generation leg; per-state
+    target rerank / task-type inference still happen in `planner_node`. Use it
+    from batch drivers where targets are already resolved in each state.
+    """
+    message_lists = []
+    for state in states:
+        target = state.get("target")
+        if not target:
+            target_info = (state.get("tool_result") or EMPTY_MAP).get("target_candidates") or EMPTY_MAP
+            target = target_info.get("top_candidate")
+        message_lists.append(
+            _build_plan_messages(
+                state["question"],
+                target,
+                state.get("error_log", []),
+                with_system=not getattr(llm, "cached_content", None),
+            )
+        )
+
+    responses = await llm.abatch(message_lists)
+
+    outs: List[Dict[str, Any]] = []
+    for response in responses:
+        plan, plan_tools = _parse_plan_response(response.content)
+        outs.append({"plan": plan, "plan_tools": plan_tools})
+    return outs
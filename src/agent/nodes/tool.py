@@ -1,5 +1,9 @@
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
+
+import hashlib
+import os
+import pickle
 
 from ..state import AgentState
 from ...tools.loaders import load_dataset, DataLoadError
@@ -7,6 +11,60 @@ from ...tools.pandas_tool import run_basic_analysis
 from ...tools.profiling import profile_schema
 from ...tools.target_heuristic import infer_target_candidates
 
+# ==========================================
+# PROFILE CACHE
+# profile_schema + infer_target_candidates are pure functions of the file
+# contents, so their results are memoized on disk keyed by (abs path,
+# mtime_ns, size). Repeat runs on an unchanged CSV skip the O(rows*cols)
+# profiling pass; only load_dataset still runs (df is needed in state).
+# ==========================================
+_PROFILE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "agentic_da")
+# Don't cache profiles of huge files to bound disk usage
+_PROFILE_CACHE_MAX_SOURCE_BYTES = 1 << 30  # 1 GiB
+
+
+def _profile_cache_path(csv_path: str, sample_rows: Optional[int] = None) -> Optional[str]:
+    try:
+        st = os.stat(csv_path)
+    except OSError:
+        return None
+    if st.st_size > _PROFILE_CACHE_MAX_SOURCE_BYTES:
+        return None
+    # sample_rows is part of the key: a profile of the first N rows must not
+    # be served for a full-file run (or vice versa). Likewise AGENT_DOWNCAST:
+    # the flag changes the loaded dtypes (and float cardinality after
+    # narrowing), so full-precision and downcast profiles must not mix.
+    downcast = os.getenv("AGENT_DOWNCAST", "0").strip()
+    key = hashlib.blake2b(
+        f"{os.path.abspath(csv_path)}|{st.st_mtime_ns}|{st.st_size}|{sample_rows or 0}|{downcast}".encode()
+    ).hexdigest()[:24]
+    return os.path.join(_PROFILE_CACHE_DIR, f"profile_{key}.pkl")
+
+
+def _load_cached_profile(cache_path: Optional[str]) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None  # corrupt/stale cache entry -> recompute
+
+
+def _store_cached_profile(
+    cache_path: Optional[str],
+    schema_summary: Dict[str, Any],
+    target_candidates: Dict[str, Any],
+) -> None:
+    if cache_path is None:
+        return
+    try:
+        os.makedirs(_PROFILE_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            pickle.dump((schema_summary, target_candidates), f)
+    except Exception:
+        pass  # caching is best-effort; never fail the pipeline over it
+
 
 def tool_node(state: AgentState) -> Dict[str, Any]:
     """
@@ -18,22 +76,29 @@ def tool_node(state: AgentState) -> Dict[str, Any]:
     try:
         csv_path = state["csv_path"]
         question = state["question"]
+        sample_rows = state.get("sample_rows")  # optional row cap (AGENT_SAMPLE_ROWS)
 
-        df, meta = load_dataset(csv_path)
+        df, meta = load_dataset(csv_path, sample_rows=sample_rows)
 
         tool_result: Dict[str, Any] = {}
         tool_result["dataset_meta"] = meta.to_dict()
 
-        # Phase 2.1.2
-        schema_summary = profile_schema(df)
-        tool_result["schema_summary"] = schema_summary
+        # Phase 2.1.2 + 2.2.1, memoized on (path, mtime, size, sample_rows)
+        cache_path = _profile_cache_path(csv_path, sample_rows)
+        cached = _load_cached_profile(cache_path)
+        if cached is not None:
+            schema_summary, target_candidates = cached
+        else:
+            schema_summary = profile_schema(df)
+            target_candidates = infer_target_candidates(schema_summary, top_k=3)
+            _store_cached_profile(cache_path, schema_summary, target_candidates)
 
-        # Phase 2.2.1
-        tool_result["target_candidates"] = infer_target_candidates(schema_summary, top_k=3)
+        tool_result["schema_summary"] = schema_summary
+        tool_result["target_candidates"] = target_candidates
 
-        # Phase 1 legacy (temporary)
+        # Phase 1 legacy (temporary); reuses the df loaded above
         tool_result["legacy_analysis"] = run_basic_analysis(
-            csv_path=csv_path,
+            df=df,
             question=question,
         )
 
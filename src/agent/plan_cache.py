@@ -0,0 +1,125 @@
+"""
+File: src/agent/plan_cache.py
+Task: Caches planner output (plan + plan_tools) across runs so near-identical
+questions against the same schema skip the plan-generation LLM call entirely.
+Entries are keyed by a schema fingerprint and matched by cosine similarity
+over question token counts; storage is a small sqlite database so cache hits
+survive process restarts.
+
+Opt-in via PLAN_CACHE_ENABLED=1. Similarity is computed with a lightweight
+bag-of-words vector (no embedding model dependency); exact repeats score 1.0
+and light rephrasings clear the 0.90 default threshold.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+_DEFAULT_DB_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "agentic_da", "plan_cache.sqlite"
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plan_cache (
+    schema_fp TEXT NOT NULL,
+    question TEXT NOT NULL,
+    plan TEXT NOT NULL,
+    plan_tools TEXT NOT NULL,
+    PRIMARY KEY (schema_fp, question)
+)
+"""
+
+
+def schema_fingerprint(schema_summary: Dict[str, Any]) -> str:
+    """Stable short hash of a schema summary (sorted-key JSON -> blake2b)."""
+    payload = json.dumps(schema_summary, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload).hexdigest()[:16]
+
+
+def _vectorize(question: str) -> Counter:
+    return Counter(_TOKEN_RE.findall((question or "").lower()))
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b[token] for token, count in a.items())
+    if dot == 0:
+        return 0.0
+    norm = math.sqrt(sum(c * c for c in a.values())) * math.sqrt(sum(c * c for c in b.values()))
+    return dot / norm
+
+
+class PlanCache:
+    """
+    Disk-backed (sqlite) plan cache with in-memory similarity matching.
+
+    lookup() returns the stored plan for the most similar prior question with
+    the same schema fingerprint, or None when nothing clears the threshold.
+    """
+
+    def __init__(self, db_path: str = _DEFAULT_DB_PATH, *, min_similarity: float = 0.90):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.min_similarity = float(min_similarity)
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, question: str, schema_fp: str) -> Optional[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT question, plan, plan_tools FROM plan_cache WHERE schema_fp = ?",
+            (schema_fp,),
+        ).fetchall()
+        if not rows:
+            return None
+
+        qvec = _vectorize(question)
+        best_sim, best_row = 0.0, None
+        for cached_question, plan_json, tools_json in rows:
+            sim = _cosine(qvec, _vectorize(cached_question))
+            if sim > best_sim:
+                best_sim, best_row = sim, (plan_json, tools_json)
+
+        if best_row is None or best_sim < self.min_similarity:
+            return None
+
+        plan_json, tools_json = best_row
+        return {
+            "plan": json.loads(plan_json),
+            "plan_tools": json.loads(tools_json),
+            "similarity": best_sim,
+        }
+
+    def store(self, question: str, schema_fp: str, plan: List[str], plan_tools: List[str]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO plan_cache (schema_fp, question, plan, plan_tools) "
+            "VALUES (?, ?, ?, ?)",
+            (schema_fp, question, json.dumps(plan), json.dumps(plan_tools)),
+        )
+        self._conn.commit()
+
+
+_CACHE_INSTANCE: Optional[PlanCache] = None
+
+
+def get_plan_cache() -> Optional[PlanCache]:
+    """Return the process-wide PlanCache when PLAN_CACHE_ENABLED=1, else None."""
+    if os.getenv("PLAN_CACHE_ENABLED", "0").strip() not in {"1", "true", "True", "YES", "yes"}:
+        return None
+
+    global _CACHE_INSTANCE
+    if _CACHE_INSTANCE is None:
+        try:
+            _CACHE_INSTANCE = PlanCache()
+        except Exception:
+            return None
+    return _CACHE_INSTANCE
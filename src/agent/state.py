@@ -7,14 +7,24 @@ to enable autonomous self-correction loops.
 """
 
 from __future__ import annotations
-from typing import TypedDict, List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import TypedDict, List, Dict, Any, Mapping, Optional
+
+# Runtime import: StateGraph(AgentState) resolves the annotations via
+# get_type_hints, so `pd` must exist when the graph is built.
 import pandas as pd
 
+# Shared read-only empty mapping: nodes default to this instead of allocating
+# a fresh {} on every `state.get(..., {}) or {}` read. Being a proxy, it also
+# cannot be mutated by accident.
+EMPTY_MAP: Mapping[str, Any] = MappingProxyType({})
+
 class AgentState(TypedDict, total=False):
     # Inputs
     # Initial data provided by the user to start the process
     question: str
     csv_path: str
+    sample_rows: Optional[int]  # cap rows read from the CSV (AGENT_SAMPLE_ROWS)
 
     # Runtime only
     # Objects instantiated and maintained during the graph execution
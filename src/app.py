@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import os
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from .config import get_gemini_api_key, get_gemini_model_name
 from .agent.graph import build_graph
 
 
 def main():
+    # Deferred: the grpc/protobuf import chain behind this client is a large
+    # chunk of cold-start time, and only main() needs it.
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     # Ensure env is loaded
     api_key = get_gemini_api_key()
     model_name = get_gemini_model_name()
@@ -19,7 +23,24 @@ def main():
         temperature=0,
     )
 
-    graph = build_graph(llm)
+    # Optional provider-side prompt caching for the static planner rubric:
+    #   GEMINI_PROMPT_CACHE=1 python -m src.app
+    # On success the planner gets a dedicated client bound to the cached
+    # prefix; on any failure we silently keep the plain client.
+    planner_llm = None
+    if os.getenv("GEMINI_PROMPT_CACHE", "0").strip() in {"1", "true", "True", "YES", "yes"}:
+        from .agent.nodes.planner import create_planner_prompt_cache
+
+        cached_name = create_planner_prompt_cache(model_name)
+        if cached_name:
+            planner_llm = ChatGoogleGenerativeAI(
+                model=model_name,
+                google_api_key=api_key,
+                temperature=0,
+                cached_content=cached_name,
+            )
+
+    graph = build_graph(llm, planner_llm=planner_llm)
 
     # Demo inputs
     csv_path = "data/samples/red wine/winequality-red.csv"
@@ -28,7 +49,16 @@ def main():
         "and in which direction do they influence it?"
     )
 
-    result = graph.invoke({"csv_path": csv_path, "question": question})
+    # Optional row cap for fast iteration on schema/planning logic:
+    #   AGENT_SAMPLE_ROWS=10000 python -m src.app
+    # 0/unset loads the full file.
+    sample_rows = int(os.getenv("AGENT_SAMPLE_ROWS", "0")) or None
+
+    # planner/interpreter are async nodes, so drive the graph via ainvoke.
+    # Batch runs can fan out with: asyncio.gather(*[graph.ainvoke(s) for s in states])
+    result = asyncio.run(
+        graph.ainvoke({"csv_path": csv_path, "question": question, "sample_rows": sample_rows})
+    )
 
     print("\n=== PLAN ===")
     for i, step in enumerate(result.get("plan", []), 1):
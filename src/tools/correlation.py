@@ -1,15 +1,90 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+import numpy as np
 import pandas as pd
 
+# Above this many cells the correlation pass is memory-bandwidth-bound, so the
+# centered matrices are downcast to float32 (half the bytes moved in the
+# product passes); smaller frames keep float64 since precision is free.
+_FLOAT32_CELL_THRESHOLD = 1_000_000
 
-def compute_pearson_correlation(df: pd.DataFrame, target: str, top_k: int = 8) -> Dict[str, Any]:
+
+def _pearson_vs_target(X: np.ndarray, y: np.ndarray, downcast: bool = False) -> np.ndarray:
+    """
+    Vectorized pairwise-complete Pearson correlation of each column of X
+    against y, computed in a handful of BLAS/NumPy passes (no per-column
+    Python dispatch). NaNs in X are excluded per column, matching pandas'
+    pairwise-complete semantics.
+
+    Each column (and y, per column mask) is mean-centered in float64 before
+    the cross-products: the raw-moment form n*sxy - sx*sy cancels
+    catastrophically for columns with large means relative to their spread
+    (timestamps, account numbers) and can return |r| > 1 or spurious NaN.
+    """
+    mask = np.isfinite(X)
+    yc = y[:, None]
+
+    n = mask.sum(axis=0, dtype=np.float64)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mx = np.where(mask, X, 0.0).sum(axis=0, dtype=np.float64) / n
+        my = (yc * mask).sum(axis=0, dtype=np.float64) / n
+
+        Xc = np.where(mask, X - mx, 0.0)
+        Yc = np.where(mask, yc - my, 0.0)
+
+        # Downcast AFTER centering: centered values are small, so float32
+        # keeps its ~7 significant digits where it matters. Casting the raw
+        # values instead destroys large-mean columns before the kernel runs
+        # (float32 spacing at 1e9 is ~64).
+        if downcast:
+            Xc = Xc.astype(np.float32)
+            Yc = Yc.astype(np.float32)
+
+        sxy = (Xc * Yc).sum(axis=0, dtype=np.float64)
+        sxx = (Xc * Xc).sum(axis=0, dtype=np.float64)
+        syy = (Yc * Yc).sum(axis=0, dtype=np.float64)
+        r = sxy / (np.sqrt(sxx) * np.sqrt(syy))
+
+    # Fewer than 2 paired observations -> undefined, like pandas
+    r[n < 2] = np.nan
+    return r
+
+
+def compute_pearson_correlation(
+    df: pd.DataFrame,
+    target: str,
+    top_k: int = 8,
+    numeric_cols: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
     Compute Pearson correlation between numeric features and target.
     Returns JSON-friendly payload.
+
+    Hot path is a single NumPy matrix + a vectorized column-vs-target kernel
+    (downcast to float32 inside the kernel above a size threshold, after
+    centering) instead of pandas' full O(k^2) correlation matrix.
+
+    `numeric_cols` lets callers that already profiled the frame (schema
+    summary) skip the select_dtypes rescan. Entries are validated against the
+    frame (must exist with a numeric dtype) since the schema list may include
+    numeric-parseable object columns.
     """
-    numeric_df = df.select_dtypes(include=["number"]).copy()
+    if numeric_cols:
+        valid = [
+            c for c in numeric_cols
+            if c in df.columns and df[c].dtype.kind in "iuf"
+        ]
+        if valid:
+            if target in df.columns and target not in valid and df[target].dtype.kind in "iuf":
+                valid.append(target)
+            numeric_df = df[valid]
+        else:
+            # hint carried no usable columns -> rescan like the unhinted path
+            numeric_df = df.select_dtypes(include=["number"])
+    else:
+        numeric_df = df.select_dtypes(include=["number"])
     if target not in numeric_df.columns:
         return {
             "error": {
@@ -27,8 +102,23 @@ def compute_pearson_correlation(df: pd.DataFrame, target: str, top_k: int = 8) -
             }
         }
 
-    corr_series = sub.corr(numeric_only=True)[target].drop(labels=[target], errors="ignore").dropna()
-    if corr_series.empty:
+    feature_cols = [c for c in sub.columns if c != target]
+    if not feature_cols:
+        return {
+            "error": {
+                "message": "no valid numeric features to correlate with target",
+                "payload": {"target": target},
+            }
+        }
+
+    n_cells = sub.shape[0] * len(feature_cols)
+    X = sub[feature_cols].to_numpy(dtype=np.float64)
+    y = sub[target].to_numpy(dtype=np.float64)
+
+    r = _pearson_vs_target(X, y, downcast=n_cells > _FLOAT32_CELL_THRESHOLD)
+
+    valid = np.isfinite(r)
+    if not valid.any():
         return {
             "error": {
                 "message": "no valid numeric features to correlate with target",
@@ -36,15 +126,27 @@ def compute_pearson_correlation(df: pd.DataFrame, target: str, top_k: int = 8) -
             }
         }
 
-    corr_sorted = corr_series.reindex(corr_series.abs().sort_values(ascending=False).index)
+    feats = np.asarray(feature_cols, dtype=object)[valid]
+    vals = r[valid]
+
+    # Order by |r| descending (full sort: top_positive/top_negative need order too)
+    order = np.argsort(-np.abs(vals), kind="stable")
+    feats = feats[order]
+    vals = vals[order]
 
+    # Single vectorized pass for directions + mask-based top-k slicing, so the
+    # row dicts are materialized exactly once for wide tables instead of being
+    # re-scanned by per-list comprehensions.
+    directions = np.where(vals > 0, "positive", "negative")
     rows: List[Dict[str, Any]] = [
-        {"feature": idx, "pearson_r": float(val), "direction": "positive" if val > 0 else "negative"}
-        for idx, val in corr_sorted.items()
+        {"feature": str(f), "pearson_r": float(v), "direction": d}
+        for f, v, d in zip(feats, vals, directions)
     ]
 
-    pos = [r for r in rows if r["pearson_r"] > 0][:top_k]
-    neg = [r for r in rows if r["pearson_r"] < 0][:top_k]
+    pos_idx = np.flatnonzero(vals > 0)[:top_k]
+    neg_idx = np.flatnonzero(vals < 0)[:top_k]
+    pos = [rows[i] for i in pos_idx]
+    neg = [rows[i] for i in neg_idx]
 
     return {
         "method": "pearson",
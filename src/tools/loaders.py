@@ -34,16 +34,43 @@ class DatasetMeta:
     n_cols: int
     columns: list[str]
 
-    # CSV-related 
+    # CSV-related
     encoding: Optional[str] = None
     sep: Optional[str] = None
     sampled: bool = False
     sample_rows: Optional[int] = None
 
+    # Source-file identity (cache keys): distinguishes reloads of a changed
+    # file at the same path.
+    mtime_ns: Optional[int] = None
+    size_bytes: Optional[int] = None
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
 
+# --------- Optional numeric downcast ---------
+
+def _maybe_downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Opt-in (AGENT_DOWNCAST=1) float64->float32 / int64->int32 downcast.
+
+    Correlations, describe() and baseline models are memory-bandwidth-bound,
+    so halving the bytes per numeric cell roughly halves their cost. Gated
+    behind an env flag because downstream consumers must tolerate float32
+    precision; int columns are only narrowed when their values fit in int32.
+    """
+    if os.getenv("AGENT_DOWNCAST", "0").strip() != "1":
+        return df
+
+    cast: Dict[str, str] = {c: "float32" for c in df.select_dtypes("float").columns}
+    for c in df.select_dtypes("int").columns:
+        s = df[c]
+        if len(s) and int(s.abs().max()) < 2**31:
+            cast[c] = "int32"
+    return df.astype(cast) if cast else df
+
+
 # --------- Loader ---------
 
 def load_dataset(
@@ -98,41 +125,48 @@ def _load_csv(
 ) -> Tuple[pd.DataFrame, DatasetMeta]:
     # Strategy:
     # 1) Try a small set of common encodings if encoding not specified
-    # 2) Use python engine if separator not specified (more flexible)
+    # 2) Prefer the C engine (5-10x faster, lower memory than python engine);
+    #    fall back to the more permissive python engine only when the C parse
+    #    fails or a custom separator was requested
     encodings_to_try = [encoding] if encoding else ["utf-8", "utf-8-sig", "latin-1"]
+    st = os.stat(path)
 
     last_err: Optional[Exception] = None
     for enc in encodings_to_try:
-        try:
-            read_kwargs = dict(
-                encoding=enc,
-                nrows=sample_rows,
-            )
-            if sep:
-                read_kwargs["sep"] = sep
-                read_kwargs["engine"] = "python"  # safe for weird separators
-            else:
-                # Let pandas infer; python engine is more permissive
-                read_kwargs["engine"] = "python"
-
-            df = pd.read_csv(path, **read_kwargs)
-
-            meta = DatasetMeta(
-                path=path,
-                file_type="csv",
-                n_rows=int(df.shape[0]),
-                n_cols=int(df.shape[1]),
-                columns=[str(c) for c in df.columns],
-                encoding=enc,
-                sep=sep,
-                sampled=sample_rows is not None,
-                sample_rows=sample_rows,
-            )
-            return df, meta
-
-        except Exception as e:
-            last_err = e
-            continue
+        engines = ("python",) if sep else ("c", "python")
+        for engine in engines:
+            try:
+                read_kwargs = dict(
+                    encoding=enc,
+                    nrows=sample_rows,
+                    engine=engine,
+                )
+                if sep:
+                    read_kwargs["sep"] = sep  # python engine: safe for weird separators
+                if engine == "c":
+                    # avoid chunked dtype-inference churn in the C parser
+                    read_kwargs["low_memory"] = False
+
+                df = _maybe_downcast(pd.read_csv(path, **read_kwargs))
+
+                meta = DatasetMeta(
+                    path=path,
+                    file_type="csv",
+                    n_rows=int(df.shape[0]),
+                    n_cols=int(df.shape[1]),
+                    columns=[str(c) for c in df.columns],
+                    encoding=enc,
+                    sep=sep,
+                    sampled=sample_rows is not None,
+                    sample_rows=sample_rows,
+                    mtime_ns=st.st_mtime_ns,
+                    size_bytes=st.st_size,
+                )
+                return df, meta
+
+            except Exception as e:
+                last_err = e
+                continue
 
     raise DataLoadError(
         "Failed to read CSV with tried encodings.",
@@ -157,6 +191,7 @@ def _load_parquet(
     if sample_rows is not None and sample_rows > 0:
         df = df.head(sample_rows)
 
+    st = os.stat(path)
     meta = DatasetMeta(
         path=path,
         file_type="parquet",
@@ -165,5 +200,7 @@ def _load_parquet(
         columns=[str(c) for c in df.columns],
         sampled=sample_rows is not None,
         sample_rows=sample_rows,
+        mtime_ns=st.st_mtime_ns,
+        size_bytes=st.st_size,
     )
     return df, meta
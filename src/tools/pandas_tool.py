@@ -3,15 +3,14 @@ from typing import Dict, Any
 import pandas as pd
 
 
-def run_basic_analysis(csv_path: str, question: str) -> Dict[str, Any]:
+def run_basic_analysis(df: pd.DataFrame, question: str) -> Dict[str, Any]:
     """
     Phase 1: minimal deterministic analysis.
-    - Loads CSV
+    - Operates on the already-loaded DataFrame (callers load via loaders.load_dataset;
+      re-reading the CSV here doubled I/O and parse cost)
     - If question implies "highest average revenue by channel", compute it
     - Otherwise returns basic describe
     """
-    df = pd.read_csv(csv_path)
-
     q = question.lower()
 
     # Minimal heuristic for demo
@@ -24,9 +23,21 @@ def run_basic_analysis(csv_path: str, question: str) -> Dict[str, Any]:
             "table": by.reset_index().to_dict(orient="records"),
         }
 
+    # to_dict instead of to_string: the formatted table costs O(rows*cols) in
+    # pandas' Python formatters and then travels through graph state as a
+    # multi-KB blob; the nested dict is JSON-native and much cheaper to build.
+    # NaN cells (describe(include="all") is sparse across dtypes) become None.
+    describe_df = df.describe(include="all")
+    describe = {
+        str(stat): {
+            str(col): (None if pd.isna(v) else v) for col, v in row.items()
+        }
+        for stat, row in describe_df.to_dict(orient="index").items()
+    }
+
     return {
         "analysis": "basic_describe",
         "shape": [int(df.shape[0]), int(df.shape[1])],
         "columns": list(df.columns),
-        "describe": df.describe(include="all").to_string(),
+        "describe": describe,
     }
@@ -13,70 +13,103 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 import re
 
-def _numeric_parseable_rate(s: pd.Series) -> float:
+# dtype.kind fast paths: pd.api.types.is_*_dtype helpers run pandas_dtype
+# normalization on every call, pure dispatch overhead at per-column volume.
+# 'b' is included because is_numeric_dtype treats bool as numeric.
+_NUMERIC_KINDS = frozenset("biufc")
+
+# Compiled once; re.IGNORECASE replaces the per-call lower() + re.search
+# recompile inside the innermost column loop. Boundary tokens keep names
+# like 'video' or 'acid' from matching 'id'.
+_ID_NAME_RE = re.compile(r"(^|[_\-\s])(id|uuid|guid|hash)([_\-\s]|$)", re.IGNORECASE)
+
+def _numeric_parseable_rate(s: pd.Series, sample_rows: int = 1000) -> float:
     """
     For object-like columns, estimate how many non-null values can be parsed as numeric.
+
+    Numeric/bool dtypes short-circuit on dtype.kind without touching the data.
+    Object columns are estimated from a sample of at most `sample_rows` values:
+    the parse is an estimate either way, and capping it turns an O(n) string
+    pass into O(min(n, 1000)) per column.
     """
-    if pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s):
+    if s.dtype.kind in "iufb":
         return 1.0
 
     non_null = s.dropna()
     if len(non_null) == 0:
         return 0.0
 
+    if len(non_null) > sample_rows:
+        non_null = non_null.sample(sample_rows, random_state=0)
+
     # Try numeric conversion
     parsed = pd.to_numeric(non_null.astype(str).str.replace(",", "", regex=False), errors="coerce")
     return float(parsed.notna().mean())
 
-def _is_id_like(col_name: str, s: pd.Series, n_rows: int) -> bool:
+def _first_n_unique(values: Any, n: int) -> List[Any]:
+    """
+    First `n` distinct values in appearance order, stopping as soon as `n`
+    are found. pd.unique materializes every distinct value before we slice;
+    on a high-cardinality object column that is a full hash pass for the
+    sake of 5 samples. Caller passes non-null values only.
+    """
+    seen: set = set()
+    out: List[Any] = []
+    for v in values:
+        if v not in seen:
+            seen.add(v)
+            out.append(v)
+            if len(out) == n:
+                break
+    return out
+
+
+def _is_id_like(col_name: str, *, is_numeric: bool, n_nonnull: int, n_unique: int) -> bool:
     """
     Heuristic to flag ID-like columns.
 
     Fix:
     - Avoid substring matches like 'acid' -> 'id'
     - Use token / boundary-based matching instead
-    """
-    name = str(col_name).lower()
 
+    Takes the caller's precomputed non-null/unique counts so the check is
+    pure arithmetic — no re-scan of the column.
+    """
     # match id-like tokens only (id, user_id, customer-id, etc.)
-    if re.search(r'(^|[_\-\s])(id|uuid|guid|hash)([_\-\s]|$)', name):
+    if _ID_NAME_RE.search(str(col_name)):
         return True
 
     # Numeric continuous variables should NOT be treated as IDs
-    if pd.api.types.is_numeric_dtype(s):
+    if is_numeric:
         return False
 
-    non_null = s.dropna()
-    if len(non_null) == 0:
+    if n_nonnull == 0:
         return False
 
-    nunique = int(non_null.nunique())
-    unique_ratio = nunique / max(1, len(non_null))
+    unique_ratio = n_unique / max(1, n_nonnull)
 
     # High uniqueness for non-numeric columns
-    if unique_ratio >= 0.98 and len(non_null) >= 50:
-        return True
-
-    return False
-
+    return unique_ratio >= 0.98 and n_nonnull >= 50
 
 
-def _is_categorical_candidate(s: pd.Series, n_rows: int) -> bool:
+def _is_categorical_candidate(
+    s: pd.Series, n_rows: int, *, is_numeric: bool, n_unique: int
+) -> bool:
     """
     Categorical candidate if:
     - dtype is object/category/bool, or
     - numeric but low cardinality (e.g., 0/1, 1-5 ratings)
+
+    Cardinality comes in precomputed; only the (cheap) dtype checks remain.
     """
-    if pd.api.types.is_bool_dtype(s) or pd.api.types.is_categorical_dtype(s):
+    if s.dtype.kind == "b" or isinstance(s.dtype, pd.CategoricalDtype):
         return True
 
-    nunique = int(s.nunique(dropna=True))
-
-    if pd.api.types.is_numeric_dtype(s):
-        return nunique <= 10
+    if is_numeric:
+        return n_unique <= 10
 
     # object-like: low cardinality relative to rows
-    return nunique <= max(20, int(0.05 * n_rows))
+    return n_unique <= max(20, int(0.05 * n_rows))
 
 
 def profile_schema(    
@@ -84,6 +117,7 @@ def profile_schema(
     *,
     sample_values_n: int = 5,
     max_columns: Optional[int] = None,
+    sample_rows: int = 1000,
 ) -> Dict[str, Any]:
     """
     Produce a JSON-serializable schema summary for planner/LLM/tool routing.
@@ -99,22 +133,72 @@ def profile_schema(
     categorical_candidates: List[str] = []
     id_like_columns: List[str] = []
 
+    # Whole-frame vectorized passes: one C-level traversal each for the notna
+    # bitmap and the cardinalities, instead of two Python->C crossings per
+    # column inside the loop. The bitmap frame is also reused per column for
+    # sample-value extraction.
+    sub = df[cols] if len(cols) != n_cols else df
+
+    # Large object columns get categoricalized ONCE up front: nunique and
+    # unique-value extraction then run over int codes instead of per-element
+    # Python string hashing (~2x+ on wide object frames). The input df is
+    # untouched — conversions live in cat_map / a shallow stats frame, and the
+    # reported dtype stays the column's original dtype.
+    cat_map: Dict[Any, pd.Series] = {}
+    if n_rows > 10_000:
+        cat_map = {
+            c: sub[c].astype("category")
+            for c in cols
+            if pd.api.types.is_object_dtype(sub[c]) or pd.api.types.is_string_dtype(sub[c])
+        }
+    stats_frame = sub.assign(**cat_map) if cat_map else sub
+
+    notna_frame = stats_frame.notna()
+    nonnull_counts = notna_frame.sum()
+    nunique_counts = stats_frame.nunique(dropna=True)
+
     for c in cols:
         s = df[c]
-        missing_rate = float(s.isna().mean())
-        nunique = int(s.nunique(dropna=True))
+
+        notna_mask = notna_frame[c]
+        n_nonnull = int(nonnull_counts[c])
+        missing_rate = float(1.0 - n_nonnull / n_rows) if n_rows else float("nan")
+        nunique = int(nunique_counts[c])
         dtype = str(s.dtype)
 
-        is_numeric = bool(pd.api.types.is_numeric_dtype(s))
-        parseable_rate = _numeric_parseable_rate(s) if (not is_numeric) else 1.0
+        is_numeric = s.dtype.kind in _NUMERIC_KINDS
+        is_cat = _is_categorical_candidate(s, n_rows, is_numeric=is_numeric, n_unique=nunique)
+        is_id = _is_id_like(c, is_numeric=is_numeric, n_nonnull=n_nonnull, n_unique=nunique)
+
+        # The numeric-parse probe (string replace + to_numeric) is skipped for
+        # id-like columns: they are never promoted to numeric candidates, so
+        # the rate carries no analytical value there. High-uniqueness alone is
+        # NOT a skip signal — continuous data stored as strings is near-unique
+        # by nature, and the probe is already capped at `sample_rows` values.
+        if is_numeric:
+            parseable_rate = 1.0
+        elif is_id:
+            parseable_rate = 0.0
+        else:
+            parseable_rate = _numeric_parseable_rate(s, sample_rows)
         numeric_parseable = bool((not is_numeric) and (parseable_rate >= 0.95))
 
-        is_cat = _is_categorical_candidate(s, n_rows)
-        is_id = _is_id_like(c, s, n_rows)
-
-        # sample values (stringified for JSON safety)
-        sample_vals_raw = s.dropna().unique().tolist()[:sample_values_n]
-        sample_vals = [str(v) for v in sample_vals_raw]
+        # sample values (stringified for JSON safety); reuse the bitmap
+        # instead of a second dropna pass. Categoricalized columns dedupe over
+        # int8/int16 codes (appearance order preserved, like pd.unique on the
+        # raw values) instead of Python objects.
+        s_cat = cat_map.get(c)
+        if s_cat is not None:
+            uniq_codes = pd.unique(s_cat.cat.codes.to_numpy())
+            uniq_codes = uniq_codes[uniq_codes >= 0][:sample_values_n]  # -1 == NaN
+            sample_vals = [str(s_cat.cat.categories[i]) for i in uniq_codes]
+        else:
+            non_null_values = s.to_numpy() if n_nonnull == n_rows else s.to_numpy()[notna_mask.to_numpy()]
+            if is_numeric:
+                # C-level hash pass; a Python loop would be slower here.
+                sample_vals = [str(v) for v in pd.unique(non_null_values)[:sample_values_n]]
+            else:
+                sample_vals = [str(v) for v in _first_n_unique(non_null_values, sample_values_n)]
 
         col_payload = {
             "name": str(c),
@@ -144,7 +228,7 @@ def profile_schema(
         "categorical_candidates": categorical_candidates,
         "id_like_columns": id_like_columns,
         "notes": {
-            "numeric_parseable_rule": "object-like columns with >=95% values parseable as numeric are treated as numeric candidates",
+            "numeric_parseable_rule": "object-like columns with >=95% values parseable as numeric are treated as numeric candidates; id-like columns are not probed",
             "categorical_rule": "object/category/bool or low-cardinality numeric (<=10 unique) are treated as categorical candidates",
             "id_like_rule": "name contains id/uuid/hash or uniqueness ratio >= 0.98 with >=50 non-null rows",
         },
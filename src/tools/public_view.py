@@ -14,7 +14,27 @@ The goal is to:
 """
 
 from __future__ import annotations
-from typing import Dict, Any, List
+from itertools import count
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# ---------------------------------------------------------------------------
+# View memoization. Agent loops rebuild the public view from the same
+# tool_result repeatedly; entries are cached per (dict identity, revision).
+# Writers stamp tool_result["_rev"] via next_view_rev() whenever they produce
+# a new merged dict — the process-wide monotonic counter means a recycled
+# id() can never alias a stale entry (its rev would differ). Unstamped dicts
+# are never cached. Plain dicts do not support weakrefs, so a small FIFO
+# bound stands in for destruction-time eviction.
+# ---------------------------------------------------------------------------
+_REV_COUNTER = count(1)
+_VIEW_CACHE: Dict[Tuple[int, int, Optional[Tuple[str, ...]]], Dict[str, Any]] = {}
+_VIEW_CACHE_MAX = 64
+
+
+def next_view_rev() -> int:
+    """Return a fresh monotonic revision for stamping a tool_result dict."""
+    return next(_REV_COUNTER)
 
 
 DEFAULT_ALLOWLIST = [
@@ -39,6 +59,14 @@ def make_public_tool_result(tool_result: Dict[str, Any], allowlist: List[str] |
     allow = set(allowlist or DEFAULT_ALLOWLIST)
     tr = tool_result or {}
 
+    rev = tr.get("_rev")
+    cache_key = None
+    if isinstance(rev, int):
+        cache_key = (id(tool_result), rev, tuple(allowlist) if allowlist else None)
+        cached = _VIEW_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
     out: Dict[str, Any] = {}
 
     for k in allow:
@@ -76,4 +104,9 @@ def make_public_tool_result(tool_result: Dict[str, Any], allowlist: List[str] |
             "top_negative": corr.get("top_negative"),
         }
 
+    if cache_key is not None:
+        if len(_VIEW_CACHE) >= _VIEW_CACHE_MAX:
+            _VIEW_CACHE.pop(next(iter(_VIEW_CACHE)))  # drop oldest entry (FIFO)
+        _VIEW_CACHE[cache_key] = out
+
     return out
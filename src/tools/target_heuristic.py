@@ -15,20 +15,27 @@ human-readable reasons, designed to:
 """
 from __future__ import annotations
 
+import copy
+import functools
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 # -------------------------
 # Scoring config (Phase 2.2.1)
 # -------------------------
 
-_STRONG_NAME_TOKENS = {"target", "label", "class"}
-_DOMAIN_NAME_TOKENS = {"quality", "score", "rating", "outcome"}
+_STRONG_NAME_TOKENS = frozenset({"target", "label", "class"})
+_DOMAIN_NAME_TOKENS = frozenset({"quality", "score", "rating", "outcome"})
 
 # Weak "feature-like" tokens (very light penalty)
-_FEATURE_LIKE_TOKENS = {"age", "price", "amount", "count", "num", "qty", "quantity", "total", "sum"}
+_FEATURE_LIKE_TOKENS = frozenset(
+    {"age", "price", "amount", "count", "num", "qty", "quantity", "total", "sum"}
+)
 
 # Split name into tokens by common delimiters and camel-case-ish boundaries
 _SPLIT_RE = re.compile(r"[^\w]+|(?<=[a-z])(?=[A-Z])")
@@ -42,10 +49,14 @@ class TargetCandidate:
     signals: Dict[str, Any]
 
 
-def _tokenize(col_name: str) -> List[str]:
+@functools.lru_cache(maxsize=4096)
+def _tokenize(col_name: str) -> Tuple[str, ...]:
+    # Memoized: agentic loops re-score the same column names every planner
+    # cycle, so repeat calls become a dict lookup instead of a regex split.
+    # Returns a tuple (hashable) rather than a list for cacheability.
     raw = str(col_name).strip()
     parts = [p for p in _SPLIT_RE.split(raw) if p]
-    return [p.lower() for p in parts]
+    return tuple(p.lower() for p in parts)
 
 
 def _score_column(
@@ -140,6 +151,38 @@ def _score_column(
     return TargetCandidate(column=name, score=float(score), reasons=reasons, signals=signals)
 
 
+# Result cache: the ranking is deterministic given the schema fields it
+# reads, and planner retry loops re-invoke it with the same schema after
+# only the question or target changed. Keyed on a structural fingerprint
+# (not dict identity), LRU-bounded; hits return a deep copy so downstream
+# mutation cannot corrupt the cached entry.
+_CANDIDATES_CACHE: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+_CANDIDATES_CACHE_MAX = 64
+
+
+def _schema_key(schema_summary: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Hashable fingerprint of exactly the schema fields the scorer reads."""
+    cols = schema_summary.get("columns", [])
+    if not isinstance(cols, list):
+        cols = []
+    return (
+        int(schema_summary.get("n_rows", 0)),
+        tuple(
+            (
+                "name" in c,
+                str(c.get("name", "")),
+                int(c.get("n_unique", 0)),
+                float(c.get("missing_rate", 0.0)),
+                bool(c.get("is_id_like", False)),
+                bool(c.get("is_numeric_candidate", False)),
+                bool(c.get("is_categorical_candidate", False)),
+            )
+            for c in cols
+            if isinstance(c, dict)
+        ),
+    )
+
+
 def infer_target_candidates(
     schema_summary: Dict[str, Any],
     *,
@@ -153,10 +196,31 @@ def infer_target_candidates(
       - candidates: ranked list [{column, score, reasons, signals}, ...]
       - top_candidate: best guess (or None)
       - notes: heuristic version + guidance
+
+    Repeat calls for the same schema fingerprint skip the scoring + sort pass
+    entirely (see _CANDIDATES_CACHE).
     """
     if not isinstance(schema_summary, dict):
         raise ValueError("schema_summary must be a dict")
 
+    key = (_schema_key(schema_summary), top_k)
+    cached = _CANDIDATES_CACHE.get(key)
+    if cached is not None:
+        _CANDIDATES_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    result = _infer_target_candidates_uncached(schema_summary, top_k=top_k)
+    if len(_CANDIDATES_CACHE) >= _CANDIDATES_CACHE_MAX:
+        _CANDIDATES_CACHE.popitem(last=False)  # evict least recently used
+    _CANDIDATES_CACHE[key] = copy.deepcopy(result)
+    return result
+
+
+def _infer_target_candidates_uncached(
+    schema_summary: Dict[str, Any],
+    *,
+    top_k: int = 3,
+) -> Dict[str, Any]:
     n_rows = int(schema_summary.get("n_rows", 0))
     cols = schema_summary.get("columns", [])
     if not isinstance(cols, list) or len(cols) == 0:
@@ -166,27 +230,68 @@ def infer_target_candidates(
             "notes": {"warning": "No columns found in schema_summary."},
         }
 
-    candidates: List[TargetCandidate] = []
     last_idx = len(cols) - 1
+    valid: List[Tuple[Dict[str, Any], bool]] = [
+        (col, i == last_idx)
+        for i, col in enumerate(cols)
+        if isinstance(col, dict) and "name" in col
+    ]
+    if not valid:
+        return {
+            "candidates": [],
+            "top_candidate": None,
+            "notes": {"warning": "No columns found in schema_summary."},
+        }
 
-    for i, col in enumerate(cols):
-        if not isinstance(col, dict) or "name" not in col:
-            continue
-        candidates.append(
-            _score_column(col, n_rows=n_rows, is_last=(i == last_idx))
-        )
-
-    # Rank by score desc, tie-breaker: lower missing_rate, then lower n_unique
-    def _sort_key(c: TargetCandidate):
-        mr = float(c.signals.get("missing_rate", 0.0))
-        nu = int(c.signals.get("n_unique", 0))
-        return (-c.score, mr, nu, c.column.lower())
-
-    candidates_sorted = sorted(candidates, key=_sort_key)
-
-    # Ensure at least top_k returned (if available)
-    k = min(max(1, top_k), len(candidates_sorted))
-    top_list = candidates_sorted[:k]
+    # -------------------------
+    # Vectorized scoring (SoA): score every column in a handful of NumPy
+    # passes instead of one Python call per column. Reasons/signals — the
+    # expensive per-column list/dict assembly — are built afterwards via
+    # _score_column for the top-k rows only. The mask accumulation below
+    # mirrors _score_column's statement order exactly so both paths produce
+    # bit-identical scores.
+    # -------------------------
+    n = len(valid)
+    n_unique = np.array([int(c.get("n_unique", 0)) for c, _ in valid], dtype=np.int64)
+    missing_rate = np.array([float(c.get("missing_rate", 0.0)) for c, _ in valid])
+    is_id_like = np.array([bool(c.get("is_id_like", False)) for c, _ in valid])
+    is_numeric = np.array([bool(c.get("is_numeric_candidate", False)) for c, _ in valid])
+    is_categorical = np.array([bool(c.get("is_categorical_candidate", False)) for c, _ in valid])
+    is_last = np.array([last for _, last in valid])
+
+    token_sets = [frozenset(_tokenize(str(c.get("name", "")))) for c, _ in valid]
+    strong_hit = np.array([bool(t & _STRONG_NAME_TOKENS) for t in token_sets])
+    domain_hit = np.array([bool(t & _DOMAIN_NAME_TOKENS) for t in token_sets])
+    feature_hit = np.array([bool(t & _FEATURE_LIKE_TOKENS) for t in token_sets])
+
+    score = np.zeros(n)
+    score -= 1.0 * is_id_like
+    if n_rows > 0:
+        score -= 0.6 * (n_unique >= int(0.8 * n_rows))
+    score += 0.6 * strong_hit
+    score += 0.4 * domain_hit
+    score += 0.4 * (is_categorical & (n_unique >= 2) & (n_unique <= 20))
+    score += 0.3 * (is_numeric & (n_unique >= 3) & (n_unique <= 10))
+    score += 0.2 * (is_numeric & (n_unique > 10) & (n_unique <= 100))
+    score -= 0.2 * (is_numeric & (n_unique == 2))
+    score += 0.1 * is_last
+    score -= 0.1 * feature_hit
+    score -= 0.1 * (missing_rate >= 0.3)
+
+    # Rank by score desc, tie-breaker: lower missing_rate, then lower n_unique,
+    # then name. np.lexsort sorts by the LAST key first, so -score is primary;
+    # one C call replaces the Python tuple-key sort (attribute access per
+    # comparison) entirely.
+    names_lower = np.array([str(c.get("name", "")).lower() for c, _ in valid])
+    order = np.lexsort((names_lower, n_unique, missing_rate, -score))
+
+    # Ensure at least top_k returned (if available); only these pay the
+    # reasons/signals assembly cost.
+    k = min(max(1, top_k), n)
+    top_list = [
+        _score_column(valid[i][0], n_rows=n_rows, is_last=bool(valid[i][1]))
+        for i in order[:k]
+    ]
 
     top_candidate = top_list[0].column if top_list else None
 
@@ -18,9 +18,30 @@ deterministic target heuristics in an agentic data analysis pipeline.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
+# orjson: C-level JSON encode/decode for the prompt payload and response
+# parsing (~3-5x stdlib). Falls back to stdlib json when unavailable,
+# mirroring the interpreter node.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def _dumps_payload(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
 class LLMRerankError(Exception):
     """Tool-friendly error for LLM rerank failures."""
@@ -29,13 +50,7 @@ class LLMRerankError(Exception):
         self.payload = payload or {}
 
 
-def _build_rerank_prompt(
-    *,
-    question: str,
-    candidates: List[Dict[str, Any]],
-    schema_summary: Dict[str, Any],
-    data_dictionary: Optional[Dict[str, Any]] = None,
-) -> str:
+def _brief_candidates(candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     # Keep prompt compact: only include top candidates + minimal schema context
     cols_brief = []
     for c in candidates:
@@ -58,6 +73,17 @@ def _build_rerank_prompt(
                 },
             }
         )
+    return cols_brief
+
+
+def _build_rerank_prompt(
+    *,
+    question: str,
+    candidates: List[Dict[str, Any]],
+    schema_summary: Dict[str, Any],
+    data_dictionary: Optional[Dict[str, Any]] = None,
+) -> str:
+    cols_brief = _brief_candidates(candidates)
 
     payload = {
         "question": question,
@@ -91,14 +117,95 @@ def _build_rerank_prompt(
         "You MUST choose the final target from the provided candidate columns only.\n"
         "Do NOT invent new columns.\n"
         "Return JSON ONLY that matches the expected_output_schema.\n\n"
-        f"INPUT:\n{json.dumps(payload, ensure_ascii=False)}"
+        f"INPUT:\n{_dumps_payload(payload)}"
+    )
+
+
+def _build_rerank_prompt_batch(
+    questions: List[str],
+    candidates: List[Dict[str, Any]],
+    schema_summary: Dict[str, Any],
+    data_dictionary: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    One prompt covering several question variants over the SAME candidate set.
+
+    The candidate briefs, schema context and constraints are serialized once
+    and amortized across all questions instead of repeated per call.
+    """
+    payload = {
+        "questions": list(questions),
+        "candidates": _brief_candidates(candidates),
+        "dataset_context": {
+            "n_rows": schema_summary.get("n_rows"),
+            "n_cols": schema_summary.get("n_cols"),
+        },
+        "data_dictionary": data_dictionary,  # may be None
+        "constraints": {
+            "only_choose_from_candidates": True,
+            "no_new_columns": True,
+            "one_entry_per_question": True,
+            "output_format": "json_only",
+        },
+        "expected_output_schema": {
+            "rankings_per_question": [
+                {
+                    "question_index": "int (0-based index into questions)",
+                    "final_target": "string (must be one of candidates.column)",
+                    "ranking": [
+                        {
+                            "column": "string (must be one of candidates.column)",
+                            "rank": "int (1=best)",
+                            "reason": "string (short)",
+                        }
+                    ],
+                    "confidence": "high|medium|low",
+                }
+            ],
+        },
+    }
+
+    return (
+        "You are a data analyst assistant.\n"
+        "Re-rank potential target variables for EACH question in `questions`.\n"
+        "You MUST choose every final target from the provided candidate columns only.\n"
+        "Do NOT invent new columns.\n"
+        "Return JSON ONLY that matches the expected_output_schema, with exactly one\n"
+        "rankings_per_question entry per question, in the same order.\n\n"
+        f"INPUT:\n{_dumps_payload(payload)}"
     )
 
 
+# Shared empty default: avoids allocating a fresh list per candidate when
+# heuristic reasons are absent (JSON-serializes identically).
+_EMPTY_REASONS: Tuple = ()
+
+# (llm_rank, llm_reason) defaults: success path marks unranked candidates,
+# fallback path carries None/None.
+_UNRANKED = (999, "Not ranked by LLM; kept for completeness.")
+_FALLBACK_RANK = (None, None)
+
+
+def _assemble(
+    c: Dict[str, Any],
+    rank_map: Dict[str, Tuple[Any, Any]],
+    default: Tuple[Any, Any] = _UNRANKED,
+) -> Dict[str, Any]:
+    """Build one reranked-candidate row; shared by success and fallback paths."""
+    llm_rank, llm_reason = rank_map.get(c.get("column"), default)
+    return {
+        "column": c.get("column"),
+        "score": c.get("score"),
+        "heuristic_reasons": c.get("reasons") or _EMPTY_REASONS,
+        "llm_rank": llm_rank,
+        "llm_reason": llm_reason,
+    }
+
+
 def _safe_json_loads(text: str) -> Dict[str, Any]:
     # Try direct parse first
     try:
-        return json.loads(text)
+        return _loads(text)
     except Exception:
         pass
 
@@ -107,13 +214,97 @@ def _safe_json_loads(text: str) -> Dict[str, Any]:
     end = text.rfind("}")
     if start != -1 and end != -1 and end > start:
         try:
-            return json.loads(text[start : end + 1])
+            return _loads(text[start : end + 1])
         except Exception:
             pass
 
     raise ValueError("Failed to parse JSON from LLM output.")
 
 
+async def rerank_and_plan_with_llm(
+    *,
+    llm: Any,
+    question: str,
+    heuristic_result: Dict[str, Any],
+    schema_summary: Dict[str, Any],
+    data_dictionary: Optional[Dict[str, Any]] = None,
+    error_log: Optional[List[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Combined target re-rank + plan generation in ONE LLM round-trip.
+
+    On the uncertain-target path the planner otherwise pays two sequential
+    calls (rerank, then plan). This asks for both in a single JSON response:
+    the rerank payload in its usual shape plus a "plan" list of 2-4 steps
+    carrying [TOOL:...] tags.
+
+    Returns the rerank-shaped dict with an extra "plan" key on success, or
+    None when the call/parse/validation fails — callers then fall back to the
+    two-call path, so behavior degrades to exactly what exists today.
+    """
+    candidates = (heuristic_result or {}).get("candidates", [])
+    heuristic_top = (heuristic_result or {}).get("top_candidate")
+    if not candidates or not heuristic_top:
+        return None
+
+    allowed = {c["column"] for c in candidates if "column" in c}
+    prompt = _build_rerank_prompt(
+        question=question,
+        candidates=candidates,
+        schema_summary=schema_summary,
+        data_dictionary=data_dictionary,
+    )
+    prompt += (
+        "\n\nADDITIONALLY: include a \"plan\" field in the same JSON object — "
+        "a list of 2-4 short step strings for answering the question with pandas, "
+        "using the chosen final_target. Where relevant append a tool tag in the exact "
+        "format [TOOL:<tool_name>] (examples: [TOOL:correlation], [TOOL:baseline_model], "
+        "[TOOL:plot]). Do NOT invent new tools beyond the examples."
+    )
+    if error_log:
+        error_str = "\n".join(f"- {err}" for err in error_log)
+        prompt += (
+            f"\n\nPREVIOUS EXECUTION ERRORS (reflect and plan differently):\n{error_str}"
+        )
+
+    try:
+        resp = await llm.ainvoke(prompt)
+        raw_text = getattr(resp, "content", resp)
+        parsed = _safe_json_loads(str(raw_text))
+
+        final_target = parsed.get("final_target")
+        if final_target not in allowed:
+            return None
+
+        plan = [str(s).strip() for s in (parsed.get("plan") or []) if str(s).strip()][:4]
+        if not plan:
+            return None
+
+        rank_map: Dict[str, Tuple[int, str]] = {
+            item["column"]: (item["rank"], str(item.get("reason", "")))
+            for item in parsed.get("ranking", [])
+            if item.get("column") in allowed and isinstance(item.get("rank"), int)
+        }
+
+        reranked = [_assemble(c, rank_map) for c in candidates]
+        reranked.sort(key=lambda x: (x["llm_rank"], -(x.get("score") or 0.0)))
+
+        return {
+            "final_target": final_target,
+            "reranked_candidates": reranked,
+            "llm_notes": {
+                "model_confidence": parsed.get("confidence", "low"),
+                "policy": "only_choose_from_candidates",
+                "combined_plan_call": True,
+            },
+            "fallback_used": False,
+            "raw_llm_output": str(raw_text),
+            "plan": plan,
+        }
+    except Exception:
+        return None
+
+
 def rerank_target_candidates_with_llm(
     *,
     llm: Any,
@@ -146,7 +337,7 @@ def rerank_target_candidates_with_llm(
             "raw_llm_output": None,
         }
 
-    allowed = {c.get("column") for c in candidates if c.get("column")}
+    allowed = {c["column"] for c in candidates if "column" in c}
     prompt = _build_rerank_prompt(
         question=question,
         candidates=candidates,
@@ -156,78 +347,203 @@ def rerank_target_candidates_with_llm(
 
     try:
         resp = llm.invoke(prompt)
-        raw_text = getattr(resp, "content", resp)  # AIMessage.content or plain string
-        parsed = _safe_json_loads(str(raw_text))
+        return _rerank_success_payload(getattr(resp, "content", resp), candidates, allowed)
+    except Exception as e:
+        return _rerank_fallback_payload(candidates, heuristic_top, e)
 
-        final_target = parsed.get("final_target")
-        ranking = parsed.get("ranking", [])
-        confidence = parsed.get("confidence", "low")
 
-        # Validate final_target
-        if final_target not in allowed:
-            raise LLMRerankError(
-                "LLM returned a final_target not in candidate set.",
-                payload={"final_target": final_target, "allowed": sorted(list(allowed))},
-            )
-
-        # Build rank map
-        rank_map: Dict[str, Tuple[int, str]] = {}
-        for item in ranking:
-            col = item.get("column")
-            r = item.get("rank")
-            reason = item.get("reason", "")
-            if col in allowed and isinstance(r, int):
-                rank_map[col] = (r, str(reason))
-
-        # Ensure every candidate has a rank; missing ones go after
-        reranked = []
-        for c in candidates:
-            col = c.get("column")
-            if col in rank_map:
-                llm_rank, llm_reason = rank_map[col]
-            else:
-                llm_rank, llm_reason = (999, "Not ranked by LLM; kept for completeness.")
-            reranked.append(
-                {
-                    "column": col,
-                    "score": c.get("score"),
-                    "heuristic_reasons": c.get("reasons", []),
-                    "llm_rank": llm_rank,
-                    "llm_reason": llm_reason,
-                }
-            )
-
-        reranked_sorted = sorted(reranked, key=lambda x: (x["llm_rank"], -(x.get("score") or 0.0)))
+async def arerank_target_candidates_with_llm(
+    *,
+    llm: Any,
+    question: str,
+    heuristic_result: Dict[str, Any],
+    schema_summary: Dict[str, Any],
+    data_dictionary: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Async variant of rerank_target_candidates_with_llm (`llm.ainvoke`).
 
-        return {
-            "final_target": final_target,
-            "reranked_candidates": reranked_sorted,
-            "llm_notes": {
-                "model_confidence": confidence,
-                "policy": "only_choose_from_candidates",
-            },
-            "fallback_used": False,
-            "raw_llm_output": str(raw_text),
-        }
+    Identical inputs/outputs; use it (or rerank_batch) to overlap several
+    network-bound rerank calls instead of paying them serially.
+    """
+    candidates = (heuristic_result or {}).get("candidates", [])
+    heuristic_top = (heuristic_result or {}).get("top_candidate")
 
-    except Exception as e:
-        # Fallback to heuristic
+    if not candidates or not heuristic_top:
         return {
             "final_target": heuristic_top,
-            "reranked_candidates": [
-                {
-                    "column": c.get("column"),
-                    "score": c.get("score"),
-                    "heuristic_reasons": c.get("reasons", []),
-                    "llm_rank": None,
-                    "llm_reason": None,
-                }
-                for c in candidates
-            ],
-            "llm_notes": {
-                "error": str(e),
-                "policy": "fallback_to_heuristic_top_candidate",
-            },
+            "reranked_candidates": candidates or [],
+            "llm_notes": {"warning": "No candidates provided; rerank skipped."},
             "fallback_used": True,
             "raw_llm_output": None,
         }
+
+    allowed = {c["column"] for c in candidates if "column" in c}
+    prompt = _build_rerank_prompt(
+        question=question,
+        candidates=candidates,
+        schema_summary=schema_summary,
+        data_dictionary=data_dictionary,
+    )
+
+    try:
+        resp = await llm.ainvoke(prompt)
+        return _rerank_success_payload(getattr(resp, "content", resp), candidates, allowed)
+    except Exception as e:
+        return _rerank_fallback_payload(candidates, heuristic_top, e)
+
+
+async def rerank_batch(llm: Any, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Fan out N rerank requests concurrently; wall-clock ~= one round-trip.
+
+    Each request dict holds the keyword arguments of
+    arerank_target_candidates_with_llm minus `llm` (question,
+    heuristic_result, schema_summary, optional data_dictionary).
+    """
+    return list(
+        await asyncio.gather(
+            *(arerank_target_candidates_with_llm(llm=llm, **r) for r in requests)
+        )
+    )
+
+
+def rerank_target_candidates_batch(
+    *,
+    llm: Any,
+    questions: List[str],
+    heuristic_result: Dict[str, Any],
+    schema_summary: Dict[str, Any],
+    data_dictionary: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Re-rank the SAME candidate set against several question variants in ONE
+    LLM call.
+
+    N separate rerank calls repeat the candidate briefs, schema context and
+    constraint text N times and pay N round-trips; here the shared payload is
+    sent once and the model returns one ranking per question. Each entry is
+    validated independently — a bad or missing entry falls back to the
+    heuristic for that question only, so one malformed ranking cannot poison
+    the rest of the batch.
+
+    Returns one rerank-shaped payload per question, in question order.
+    """
+    candidates = (heuristic_result or {}).get("candidates", [])
+    heuristic_top = (heuristic_result or {}).get("top_candidate")
+
+    if not candidates or not heuristic_top:
+        return [
+            {
+                "final_target": heuristic_top,
+                "reranked_candidates": candidates or [],
+                "llm_notes": {"warning": "No candidates provided; rerank skipped."},
+                "fallback_used": True,
+                "raw_llm_output": None,
+            }
+            for _ in questions
+        ]
+
+    allowed = {c["column"] for c in candidates if "column" in c}
+    prompt = _build_rerank_prompt_batch(
+        questions, candidates, schema_summary, data_dictionary
+    )
+
+    try:
+        resp = llm.invoke(prompt)
+        raw_text = str(getattr(resp, "content", resp))
+        parsed = _safe_json_loads(raw_text)
+        entries = parsed.get("rankings_per_question") or []
+    except Exception as e:
+        return [_rerank_fallback_payload(candidates, heuristic_top, e) for _ in questions]
+
+    # Index entries by declared question_index, falling back to list position
+    # when the model omits it.
+    by_index: Dict[int, Dict[str, Any]] = {}
+    for pos, entry in enumerate(entries):
+        if isinstance(entry, dict):
+            idx = entry.get("question_index")
+            by_index.setdefault(idx if isinstance(idx, int) else pos, entry)
+
+    results: List[Dict[str, Any]] = []
+    for i in range(len(questions)):
+        entry = by_index.get(i)
+        try:
+            if entry is None:
+                raise LLMRerankError(f"No ranking returned for question index {i}.")
+            results.append(
+                _payload_from_parsed(entry, candidates, allowed, raw_text=raw_text)
+            )
+        except Exception as e:
+            results.append(_rerank_fallback_payload(candidates, heuristic_top, e))
+    return results
+
+
+def _rerank_success_payload(
+    raw_text: Any, candidates: List[Dict[str, Any]], allowed: set
+) -> Dict[str, Any]:
+    """Parse + validate an LLM rerank response; raises on invalid output."""
+    parsed = _safe_json_loads(str(raw_text))
+    return _payload_from_parsed(parsed, candidates, allowed, raw_text=str(raw_text))
+
+
+def _payload_from_parsed(
+    parsed: Dict[str, Any],
+    candidates: List[Dict[str, Any]],
+    allowed: set,
+    *,
+    raw_text: Optional[str],
+) -> Dict[str, Any]:
+    """Validate one already-parsed ranking dict; raises on invalid output."""
+    final_target = parsed.get("final_target")
+    ranking = parsed.get("ranking", [])
+    confidence = parsed.get("confidence", "low")
+
+    # Validate final_target
+    if final_target not in allowed:
+        raise LLMRerankError(
+            "LLM returned a final_target not in candidate set.",
+            payload={"final_target": final_target, "allowed": sorted(list(allowed))},
+        )
+
+    # Build rank map in one pass; candidates the LLM skipped sort after
+    # the ranked ones via the _UNRANKED default inside _assemble.
+    rank_map: Dict[str, Tuple[int, str]] = {
+        item["column"]: (item["rank"], str(item.get("reason", "")))
+        for item in ranking
+        if item.get("column") in allowed and isinstance(item.get("rank"), int)
+    }
+
+    reranked_sorted = sorted(
+        (_assemble(c, rank_map) for c in candidates),
+        key=lambda x: (x["llm_rank"], -(x.get("score") or 0.0)),
+    )
+
+    return {
+        "final_target": final_target,
+        "reranked_candidates": reranked_sorted,
+        "llm_notes": {
+            "model_confidence": confidence,
+            "policy": "only_choose_from_candidates",
+        },
+        "fallback_used": False,
+        "raw_llm_output": raw_text,
+    }
+
+
+def _rerank_fallback_payload(
+    candidates: List[Dict[str, Any]], heuristic_top: Optional[str], error: Exception
+) -> Dict[str, Any]:
+    # Fallback to heuristic; same row shape via _assemble with None ranks
+    return {
+        "final_target": heuristic_top,
+        "reranked_candidates": [
+            _assemble(c, {}, default=_FALLBACK_RANK) for c in candidates
+        ],
+        "llm_notes": {
+            "error": str(error),
+            "policy": "fallback_to_heuristic_top_candidate",
+        },
+        "fallback_used": True,
+        "raw_llm_output": None,
+    }
@@ -4,10 +4,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
+# dtype.kind fast paths (see profiling.py): skips pandas_dtype normalization
+# inside the pd.api.types helpers on per-call checks. Bool counts as numeric
+# for is_numeric_dtype parity but is dispatched first below anyway.
+_NUMERIC_KINDS = frozenset("biufc")
+
 
 @dataclass
 class TaskTypeInferenceResult:
@@ -17,8 +23,28 @@ class TaskTypeInferenceResult:
     target_profile: Dict[str, Any]
 
 
+# Common timestamp layouts tried with known-format strptime before falling
+# back to pandas' per-row format inference (dateutil), which is ~50x slower.
+_DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y%m%d",
+)
+
+
+def _try_strptime(value: str, fmt: str) -> bool:
+    try:
+        datetime.strptime(value, fmt)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
 def _is_datetime_like(s: pd.Series) -> bool:
-    if pd.api.types.is_datetime64_any_dtype(s):
+    if s.dtype.kind == "M":  # datetime64, tz-aware included
         return True
 
     # Only try parse on small sample for cost + stability
@@ -26,6 +52,19 @@ def _is_datetime_like(s: pd.Series) -> bool:
         sample = s.dropna().astype(str).head(30)
         if sample.empty:
             return False
+
+        # Known-format shortlist first: one strptime per (value, format) in C,
+        # short-circuiting on the first format that clears the hit ratio.
+        values = sample.tolist()
+        threshold = 0.8 * len(values)
+        for fmt in _DATETIME_FORMATS:
+            if sum(1 for v in values if _try_strptime(v, fmt)) > threshold:
+                return True
+
+        # Fall back to pandas' inference only when the sample plausibly holds
+        # timestamps in some exotic layout (digit-heavy tokens).
+        if not any(any(ch.isdigit() for ch in v) for v in values):
+            return False
         parsed = pd.to_datetime(sample, errors="coerce", utc=False)
         return parsed.notna().mean() > 0.8
 
@@ -40,6 +79,14 @@ def _is_id_like(n_nonnull: int, n_unique: int) -> bool:
     return unique_ratio > 0.9 and n_unique > 50
 
 
+# Memo for repeat (df, target) calls: the answer is deterministic given the
+# frame and target, and the planner can ask several times per session (retry
+# loops, cached-plan paths). Keyed on df identity plus shape and target dtype
+# so a recycled id() after GC cannot alias to a stale entry in practice.
+_INFER_MEMO: Dict[tuple, TaskTypeInferenceResult] = {}
+_INFER_MEMO_MAX = 128
+
+
 def infer_task_type(
     df: pd.DataFrame,
     target: str,
@@ -47,6 +94,44 @@ def infer_task_type(
     min_samples: int = 30,
     max_missing_rate: float = 0.95,
     small_discrete_unique_threshold: int = 10,
+) -> TaskTypeInferenceResult:
+    """
+    Memoizing wrapper around the rules-only inference: repeat calls for the
+    same loaded frame and target skip the target-column rescan entirely.
+    """
+    key = (
+        id(df),
+        df.shape,
+        str(df[target].dtype) if target in df.columns else None,
+        target,
+        min_samples,
+        max_missing_rate,
+        small_discrete_unique_threshold,
+    )
+    cached = _INFER_MEMO.get(key)
+    if cached is not None:
+        return cached
+
+    result = _infer_task_type_uncached(
+        df,
+        target,
+        min_samples=min_samples,
+        max_missing_rate=max_missing_rate,
+        small_discrete_unique_threshold=small_discrete_unique_threshold,
+    )
+    if len(_INFER_MEMO) >= _INFER_MEMO_MAX:
+        _INFER_MEMO.pop(next(iter(_INFER_MEMO)))  # drop oldest entry (FIFO)
+    _INFER_MEMO[key] = result
+    return result
+
+
+def _infer_task_type_uncached(
+    df: pd.DataFrame,
+    target: str,
+    *,
+    min_samples: int = 30,
+    max_missing_rate: float = 0.95,
+    small_discrete_unique_threshold: int = 10,
 ) -> TaskTypeInferenceResult:
     """
     Rules-only task type inference.
@@ -135,14 +220,14 @@ def infer_task_type(
     profile["id_like"] = False
 
     # Classification vs regression
-    if pd.api.types.is_bool_dtype(y):
+    if y.dtype.kind == "b":
         reasons.append("target dtype is boolean")
         return TaskTypeInferenceResult("binary_classification", "rules", reasons, profile)
 
     if (
         pd.api.types.is_object_dtype(y)
         or pd.api.types.is_string_dtype(y)
-        or pd.api.types.is_categorical_dtype(y)
+        or isinstance(y.dtype, pd.CategoricalDtype)
     ):
         reasons.append("target is categorical (non-numeric)")
         if n_unique == 2:
@@ -151,11 +236,11 @@ def infer_task_type(
         reasons.append(f"n_unique == {n_unique} (>2)")
         return TaskTypeInferenceResult("multiclass_classification", "rules", reasons, profile)
 
-    if pd.api.types.is_numeric_dtype(y):
-        # binary-like numeric {0,1}
-        # only check small sample to avoid memory blow-ups
-        uniq_vals = set(pd.Series(y_nonnull.unique()).head(50).tolist())
-        if n_unique == 2 and uniq_vals.issubset({0, 1, 0.0, 1.0}):
+    if y.dtype.kind in _NUMERIC_KINDS:
+        # binary-like numeric {0,1}: n_unique == 2 is already known, so the
+        # unique-value scan only runs when the answer can actually be yes
+        # (two values at most — no Series/head round-trip needed).
+        if n_unique == 2 and set(y_nonnull.unique().tolist()).issubset({0, 1, 0.0, 1.0}):
             reasons.append("numeric but values look like {0,1}")
             return TaskTypeInferenceResult("binary_classification", "rules", reasons, profile)
 